@@ -1,5 +1,5 @@
 import requests
-from typing import Dict, List
+from typing import Dict, List, Optional
 import re
 
 class DuplicationChecker:
@@ -21,19 +21,20 @@ class DuplicationChecker:
         Returns:
             Dict with title and uniqueness info
         """
-        # Generate candidate titles
-        candidate_titles = self._generate_title_candidates(keywords, research)
-        
-        # Check each title for uniqueness
-        for title in candidate_titles:
-            is_unique = self._check_title_uniqueness(title)
-            if is_unique:
-                return {
-                    "title": title,
-                    "is_unique": True,
-                    "similarity_score": 0.0,
-                    "checked_against": "web_search"
-                }
+        return self.find_unique_base_title(keywords) or self.find_unique_research_title(keywords, research)
+    
+    def find_unique_base_title(self, keywords: List[str]) -> Optional[Dict]:
+        """
+        Check the title candidates that don't depend on research
+        Returns the first unique one, or None; safe to run while research is gathered
+        """
+        return self._first_unique_title(self._base_title_candidates(keywords))
+    
+    def find_unique_research_title(self, keywords: List[str], research: Dict) -> Dict:
+        """Check the trending-topic title candidates, falling back to a forced unique title"""
+        result = self._first_unique_title(self._trending_title_candidates(keywords, research))
+        if result:
+            return result
         
         # If no unique title found, create a more specific one
         unique_title = self._force_unique_title(keywords)
@@ -45,12 +46,24 @@ class DuplicationChecker:
             "note": "Generated unique title with timestamp/specific angle"
         }
     
-    def _generate_title_candidates(self, keywords: List[str], research: Dict) -> List[str]:
-        """Generate multiple title candidates"""
+    def _first_unique_title(self, candidate_titles: List[str]) -> Optional[Dict]:
+        """Check each title for uniqueness and return the first unique one"""
+        for title in candidate_titles:
+            is_unique = self._check_title_uniqueness(title)
+            if is_unique:
+                return {
+                    "title": title,
+                    "is_unique": True,
+                    "similarity_score": 0.0,
+                    "checked_against": "web_search"
+                }
+        return None
+    
+    def _base_title_candidates(self, keywords: List[str]) -> List[str]:
+        """Generate the keyword-only title candidates"""
         primary_keyword = keywords[0] if keywords else "AI Technology"
-        trending_topics = research.get('trending_topics', [])
         
-        templates = [
+        return [
             f"The Future of {primary_keyword}: What You Need to Know in 2024",
             f"{primary_keyword}: Complete Guide to Implementation and Benefits",
             f"How {primary_keyword} is Revolutionizing Modern Technology",
@@ -60,17 +73,21 @@ class DuplicationChecker:
             f"{primary_keyword}: From Theory to Real-World Applications",
             f"Understanding {primary_keyword}: Key Insights and Future Predictions"
         ]
+    
+    def _trending_title_candidates(self, keywords: List[str], research: Dict) -> List[str]:
+        """Generate title variations on the top trending topic"""
+        primary_keyword = keywords[0] if keywords else "AI Technology"
+        trending_topics = research.get('trending_topics', [])
         
-        # Add trending topic variations
-        if trending_topics:
-            trending = trending_topics[0]
-            templates.extend([
-                f"{primary_keyword} and {trending}: A Perfect Match",
-                f"How {trending} is Shaping {primary_keyword}",
-                f"{primary_keyword} in the Age of {trending}"
-            ])
+        if not trending_topics:
+            return []
         
-        return templates
+        trending = trending_topics[0]
+        return [
+            f"{primary_keyword} and {trending}: A Perfect Match",
+            f"How {trending} is Shaping {primary_keyword}",
+            f"{primary_keyword} in the Age of {trending}"
+        ]
     
     def _check_title_uniqueness(self, title: str) -> bool:
         """Check if title is unique using search"""
@@ -3,6 +3,9 @@ from typing import Dict, List
 import json
 import tiktoken
 
+# Inputs sharing one extraction call; latency grows sublinearly up to about 8
+KEYWORD_BATCH_SIZE = 8
+
 class KeywordExtractor:
     """Agent 2: Extract SEO keywords using GPT-4 mini"""
     
@@ -77,14 +80,7 @@ No explanation, just the JSON array."""
             # Calculate cost
             cost = self.config.estimate_cost(input_tokens, output_tokens)
             
-            return {
-                "keywords": keywords,
-                "primary_keyword": keywords[0] if keywords else phrase.lower(),
-                "secondary_keywords": keywords[1:4] if len(keywords) > 1 else [],
-                "long_tail_keywords": [kw for kw in keywords if len(kw.split()) >= 3],
-                "cost": cost,
-                "tokens_used": input_tokens + output_tokens
-            }
+            return self._build_result(keywords, phrase, cost, input_tokens + output_tokens)
             
         except Exception as e:
             print(f"⚠️  Keyword extraction failed: {e}")
@@ -100,6 +96,93 @@ No explanation, just the JSON array."""
                 "fallback_used": True
             }
     
+    def extract_batch(self, normalized_inputs: List[Dict]) -> List[Dict]:
+        """
+        Extract keywords for several topics, up to KEYWORD_BATCH_SIZE per LLM call
+        Args:
+            normalized_inputs: Outputs from InputNormalizer
+        Returns:
+            List of dicts shaped like extract()'s result, in input order
+        """
+        results = []
+        for start in range(0, len(normalized_inputs), KEYWORD_BATCH_SIZE):
+            results.extend(self._extract_chunk(normalized_inputs[start:start + KEYWORD_BATCH_SIZE]))
+        return results
+    
+    def _extract_chunk(self, chunk: List[Dict]) -> List[Dict]:
+        """Extract keywords for one batch of topics with a single LLM call"""
+        if len(chunk) == 1:
+            return [self.extract(chunk[0])]
+        
+        topics = "\n".join(
+            f'{i}) "{item["cleaned"]}" (Content Angle: {item["suggested_angle"]})'
+            for i, item in enumerate(chunk, 1)
+        )
+        prompt = f"""You are an SEO expert specializing in Artificial Intelligence content.
+
+Extract 5-7 high-value SEO keywords for each of these articles:
+{topics}
+
+Context: {chunk[0]['context']}
+
+Requirements:
+- Focus on AI/Technology related keywords
+- Include both short-tail (1-2 words) and long-tail (3+ words) keywords
+- Keywords should have good search volume potential
+- Mix informational and commercial intent keywords
+
+Return ONLY a JSON object mapping each article number to its JSON array of keywords, ranked by importance:
+{{"1": ["keyword1", "keyword2", ...], "2": ["keyword1", ...], ...}}
+
+No explanation, just the JSON object."""
+
+        try:
+            input_tokens = len(self.encoder.encode(prompt))
+            
+            response = self.client.chat.completions.create(
+                model=self.config.OPENAI_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=200 * len(chunk),
+                temperature=0.3,
+                response_format={"type": "json_object"}
+            )
+            
+            content = response.choices[0].message.content
+            output_tokens = len(self.encoder.encode(content))
+            keywords_by_item = json.loads(content)
+            if not isinstance(keywords_by_item, dict):
+                raise ValueError("expected a JSON object keyed by article number")
+        
+        except Exception as e:
+            print(f"⚠️  Batch keyword extraction failed: {e}")
+            return [self.extract(item) for item in chunk]
+        
+        # Each article carries an equal share of the call's cost
+        cost = self.config.estimate_cost(input_tokens, output_tokens) / len(chunk)
+        tokens_used = (input_tokens + output_tokens) // len(chunk)
+        
+        results = []
+        for i, item in enumerate(chunk, 1):
+            keywords = keywords_by_item.get(str(i))
+            if not isinstance(keywords, list) or not keywords:
+                # Missing from the batched answer; extract this one on its own
+                results.append(self.extract(item))
+                continue
+            results.append(self._build_result(keywords[:self.config.MAX_KEYWORDS], item['cleaned'], cost, tokens_used))
+        
+        return results
+    
+    def _build_result(self, keywords: List[str], phrase: str, cost: float, tokens_used: int) -> Dict:
+        """Assemble the extraction result for one topic"""
+        return {
+            "keywords": keywords,
+            "primary_keyword": keywords[0] if keywords else phrase.lower(),
+            "secondary_keywords": keywords[1:4] if len(keywords) > 1 else [],
+            "long_tail_keywords": [kw for kw in keywords if len(kw.split()) >= 3],
+            "cost": cost,
+            "tokens_used": tokens_used
+        }
+    
     def _fallback_extraction(self, phrase: str) -> List[str]:
         """Fallback keyword extraction using rules"""
         phrase_lower = phrase.lower()
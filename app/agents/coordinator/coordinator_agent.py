@@ -9,7 +9,7 @@ from datetime import datetime
 import structlog
 import uuid
 
-from app.core import BaseAgent, AgentType, AgentCommunicationHub
+from app.core import BaseAgent, AgentType, AgentCommunicationHub, WorkflowCache, workflow_cache
 from app.agents.researcher import ResearchAgent
 from app.agents.writer import WriterAgent
 from app.agents.editor import EditorAgent
@@ -19,9 +19,13 @@ logger = structlog.get_logger()
 class CoordinatorAgent(BaseAgent):
     """Coordinator Agent for orchestrating content generation workflow"""
     
-    def __init__(self, agent_id: str, name: str = "Coordinator Agent"):
+    def __init__(self, agent_id: str, name: str = "Coordinator Agent",
+                 cache: Optional[WorkflowCache] = None):
         super().__init__(agent_id, AgentType.COORDINATOR, name)
         
+        # Research and editing results, shared across coordinators unless one is given
+        self.workflow_cache = cache or workflow_cache
+        
         # Initialize communication hub
         self.communication_hub = AgentCommunicationHub()
         
@@ -91,6 +95,11 @@ class CoordinatorAgent(BaseAgent):
     async def _initialize_agents(self):
         """Initialize and coordinate all sub-agents"""
         try:
+            # Sub-agents and the running hub are reused by later workflows of this coordinator
+            if self.researcher and self.writer and self.editor and self.communication_hub.running:
+                logger.info("Reusing initialized agents")
+                return
+            
             logger.info("Initializing and coordinating agents")
             
             # Create agent instances
@@ -138,11 +147,20 @@ class CoordinatorAgent(BaseAgent):
                 "include_examples": True
             }
             
+            # Reuse research already done for the same context
+            cache_key = self.workflow_cache.make_key("research", research_context)
+            research_result = self.workflow_cache.get(cache_key, "research")
+            if research_result is not None:
+                logger.info("Research phase served from workflow cache")
+                self.agent_statuses["researcher"] = "completed"
+                return research_result
+            
             # Execute research
             research_result = await self.researcher.execute(research_context)
             
             if research_result.get("status") == "success":
                 logger.info("Research phase completed successfully")
+                self.workflow_cache.put(cache_key, "research", research_result)
                 
                 # Update agent status
                 self.agent_statuses["researcher"] = "completed"
@@ -235,11 +253,20 @@ class CoordinatorAgent(BaseAgent):
                 "include_quality_analysis": True
             }
             
+            # Reuse edits already made to the same draft
+            cache_key = self.workflow_cache.make_key("editing", editing_context)
+            editing_result = self.workflow_cache.get(cache_key, "editing")
+            if editing_result is not None:
+                logger.info("Editing phase served from workflow cache")
+                self.agent_statuses["editor"] = "completed"
+                return editing_result
+            
             # Execute editing
             editing_result = await self.editor.execute(editing_context)
             
             if editing_result.get("status") == "success":
                 logger.info("Editing phase completed successfully")
+                self.workflow_cache.put(cache_key, "editing", editing_result)
                 
                 # Update agent status
                 self.agent_statuses["editor"] = "completed"
@@ -7,10 +7,9 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import structlog
-from openai import OpenAI
 import os
 
-from app.core import BaseAgent, AgentType
+from app.core import BaseAgent, AgentType, get_openai_client
 from .tools import EditingTools
 
 logger = structlog.get_logger()
@@ -24,7 +23,7 @@ class EditorAgent(BaseAgent):
         # Initialize OpenAI client if API key is available
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
+            self.openai_client = get_openai_client(api_key)
         else:
             self.openai_client = None
             logger.warning("No OpenAI API key provided, using fallback mode")
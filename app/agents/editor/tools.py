@@ -4,18 +4,39 @@ Provides content analysis, fact-checking, and editing capabilities
 """
 
 import re
+from collections import Counter
 from typing import Dict, Any, List, Optional
 import structlog
 from textstat import textstat
 
 logger = structlog.get_logger()
 
+# Whole words, as matched by \b\w+\b
+WORD_PATTERN = re.compile(r'\w+')
+
+# Topic words too common to signal relevance
+TOPIC_STOP_WORDS = frozenset({'the', 'and', 'or', 'in', 'of', 'to', 'for'})
+
 class EditingTools:
     """Tools for content editing, quality analysis, and fact-checking"""
     
     def __init__(self):
         logger.info("EditingTools initialized")
     
+    def warmup(self):
+        """Run the scorers once on a tiny input
+        
+        textstat loads its hyphenation dictionary and the claim patterns are
+        compiled on first use; paying that here keeps it out of the first real analysis.
+        """
+        sample = "AI improves diagnosis. Studies show 90% accuracy in 2024."
+        self._calculate_readability_score(sample)
+        self._calculate_topic_relevance(sample, "AI diagnosis")
+        self._analyze_content_structure(sample)
+        self._analyze_content_completeness(sample, "AI diagnosis")
+        self._analyze_grammar_quality(sample)
+        self._extract_factual_claims(sample)
+    
     async def analyze_content_quality(self, content: str, topic: str) -> Dict[str, Any]:
         """Analyze content quality across multiple dimensions"""
         try:
@@ -84,23 +105,17 @@ class EditingTools:
                 return 0.0
             
             # Extract key terms from topic
-            topic_terms = set(re.findall(r'\b\w+\b', topic.lower()))
-            topic_terms.discard('the')
-            topic_terms.discard('and')
-            topic_terms.discard('or')
-            topic_terms.discard('in')
-            topic_terms.discard('of')
-            topic_terms.discard('to')
-            topic_terms.discard('for')
-            
-            # Count topic term occurrences in content
-            content_lower = content.lower()
+            topic_terms = set(WORD_PATTERN.findall(topic.lower())) - TOPIC_STOP_WORDS
+            
+            # Count topic term occurrences in content, tokenizing it once
+            # rather than scanning it again for every term
+            content_words = Counter(WORD_PATTERN.findall(content.lower()))
             term_counts = {}
             total_terms = 0
             
             for term in topic_terms:
                 if len(term) > 2:  # Only count meaningful terms
-                    count = len(re.findall(rf'\b{re.escape(term)}\b', content_lower))
+                    count = content_words[term]
                     term_counts[term] = count
                     total_terms += count
             
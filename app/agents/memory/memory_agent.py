@@ -4,10 +4,11 @@ Handles advanced context management, memory operations, and knowledge retrieval
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import structlog
 import uuid
+import numpy as np
 from collections import defaultdict
 
 from app.core import BaseAgent, AgentType, AgentMemory
@@ -15,6 +16,11 @@ from app.core.memory_manager import MemoryManager
 
 logger = structlog.get_logger()
 
+# Bookkeeping writes run in the background: at most this many at once,
+# and new operations wait once this many are queued
+MAX_CONCURRENT_WRITES = 16
+MAX_PENDING_WRITES = 64
+
 class MemoryAgent(BaseAgent):
     """Memory Agent for advanced context management and memory operations"""
     
@@ -39,10 +45,25 @@ class MemoryAgent(BaseAgent):
         self.temporal_index = defaultdict(list)
         self.semantic_index = defaultdict(list)
         
+        # Background writes, referenced until done so they are not garbage collected
+        self._write_sem = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
+        self._background_tasks: Set[asyncio.Task] = set()
+        
+        # Cleanups run in the background, at most one per cleanup type. They are kept
+        # apart from the write backlog so a long scan never holds up a store.
+        self._cleanup_tasks: Dict[str, asyncio.Task] = {}
+        self.cleanup_results: Dict[str, Dict[str, Any]] = {}
+        
         logger.info(f"Memory Agent {name} initialized")
     
     async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute memory management task"""
+        """Execute memory management task
+        
+        The "cleanup" operation runs in the background and returns
+        {"status": "started" | "queued", "background": True, ...} instead of the
+        cleanup result. Await wait_for_cleanup(cleanup_type) for the result, or
+        pass "wait": True in the context to get it directly as before.
+        """
         try:
             operation = context.get("operation", "retrieve")
             memory_type = context.get("memory_type", "general")
@@ -78,6 +99,68 @@ class MemoryAgent(BaseAgent):
             await self.handle_error(e, "memory operation")
             return {"status": "error", "error": str(e)}
     
+    async def batch_execute(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute several memory operations in order, one result per operation
+        
+        Consecutive store operations are written together with one embedding
+        request and one commit instead of a round trip each.
+        """
+        results = []
+        stores = []
+        for context in operations:
+            if context.get("operation") == "store":
+                stores.append(context)
+                continue
+            if stores:
+                results.extend(await self._batch_store_memory_operation(stores))
+                stores = []
+            results.append(await self.execute(context))
+        if stores:
+            results.extend(await self._batch_store_memory_operation(stores))
+        return results
+    
+    async def _batch_store_memory_operation(self, contexts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Handle a run of memory storage operations as one batch"""
+        try:
+            await self.start_task(f"Memory operation: batch store of {len(contexts)} memories")
+            
+            memory_ids = await self.store_memory_batch([
+                {
+                    "content": context.get("content", ""),
+                    "memory_type": context.get("memory_type", "general"),
+                    "importance_score": context.get("importance", 0.5),
+                    "metadata": context.get("metadata", {})
+                }
+                for context in contexts
+            ])
+            if len(memory_ids) != len(contexts):
+                raise RuntimeError("Batch memory storage failed")
+            
+            stored_at = datetime.now().isoformat()
+            results = []
+            for context, memory_id in zip(contexts, memory_ids):
+                memory_type = context.get("memory_type", "general")
+                await self._update_memory_indexes(memory_id, context.get("content", ""), memory_type, context.get("metadata", {}))
+                results.append({
+                    "status": "success",
+                    "operation": "store",
+                    "memory_id": memory_id,
+                    "memory_type": memory_type,
+                    "stored_at": stored_at
+                })
+            
+            await self.complete_task({
+                "operation": "store",
+                "stored": len(memory_ids)
+            })
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Batch memory storage operation failed: {e}")
+            await self.handle_error(e, "batch memory storage")
+            return [{"status": "error", "error": str(e)} for _ in contexts]
+    
     async def _store_memory_operation(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle memory storage operations"""
         try:
@@ -95,9 +178,8 @@ class MemoryAgent(BaseAgent):
             await self._update_memory_indexes(memory_id, content, memory_type, metadata)
             
             # Store in agent memory for quick access
-            await self.store_memory(
+            await self._record_operation(
                 f"Memory stored: {memory_type} - {content[:50]}...",
-                "memory_operation",
                 0.8,
                 {"operation": "store", "memory_id": memory_id, "type": memory_type}
             )
@@ -131,9 +213,8 @@ class MemoryAgent(BaseAgent):
             filtered_memories = await self._apply_advanced_filters(memories, filters)
             
             # Store retrieval operation
-            await self.store_memory(
+            await self._record_operation(
                 f"Memory retrieved: {len(filtered_memories)} memories for {memory_type}",
-                "memory_operation",
                 0.7,
                 {"operation": "retrieve", "count": len(filtered_memories), "type": memory_type}
             )
@@ -166,9 +247,8 @@ class MemoryAgent(BaseAgent):
                 result = {"error": f"Unknown organization type: {organization_type}"}
             
             # Store organization operation
-            await self.store_memory(
+            await self._record_operation(
                 f"Memory organized: {organization_type} operation completed",
-                "memory_operation",
                 0.8,
                 {"operation": "organize", "type": organization_type}
             )
@@ -180,26 +260,58 @@ class MemoryAgent(BaseAgent):
             return {"status": "error", "error": str(e)}
     
     async def _cleanup_memory_operation(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle memory cleanup operations"""
+        """Handle memory cleanup operations
+        
+        The cleanup runs in the background; its result lands in cleanup_results.
+        A request for a cleanup type that is already running is absorbed by it.
+        With context["wait"] the cleanup result is awaited and returned.
+        """
         try:
             cleanup_type = context.get("cleanup_type", "expired")
             threshold = context.get("threshold", 30)  # days
             
-            if cleanup_type == "expired":
-                result = await self._cleanup_expired_memories(threshold)
-            elif cleanup_type == "low_importance":
-                result = await self._cleanup_low_importance_memories()
-            elif cleanup_type == "duplicates":
-                result = await self._cleanup_duplicate_memories()
+            if cleanup_type not in ("expired", "low_importance", "duplicates"):
+                return {"error": f"Unknown cleanup type: {cleanup_type}"}
+            
+            if cleanup_type in self._cleanup_tasks:
+                status = "queued"
             else:
-                result = {"error": f"Unknown cleanup type: {cleanup_type}"}
+                status = "started"
+                task = asyncio.create_task(self._run_cleanup(cleanup_type, threshold))
+                self._cleanup_tasks[cleanup_type] = task
+                task.add_done_callback(lambda _: self._cleanup_tasks.pop(cleanup_type, None))
             
-            return result
+            if context.get("wait"):
+                return await self.wait_for_cleanup(cleanup_type)
+            
+            return {"status": status, "operation": "cleanup", "cleanup_type": cleanup_type, "background": True}
             
         except Exception as e:
             logger.error(f"Memory cleanup operation failed: {e}")
             return {"status": "error", "error": str(e)}
     
+    async def _run_cleanup(self, cleanup_type: str, threshold: int) -> Dict[str, Any]:
+        """Run one cleanup and keep its result; failures are kept as error results"""
+        try:
+            if cleanup_type == "expired":
+                result = await self._cleanup_expired_memories(threshold)
+            elif cleanup_type == "low_importance":
+                result = await self._cleanup_low_importance_memories()
+            else:
+                result = await self._cleanup_duplicate_memories()
+        except Exception as e:
+            logger.error(f"Background {cleanup_type} cleanup failed: {e}")
+            result = {"status": "error", "error": str(e)}
+        self.cleanup_results[cleanup_type] = result
+        return result
+    
+    async def wait_for_cleanup(self, cleanup_type: str) -> Dict[str, Any]:
+        """Wait for a running cleanup and return its result, or the last result if none is running"""
+        task = self._cleanup_tasks.get(cleanup_type)
+        if task is not None:
+            return await asyncio.shield(task)
+        return self.cleanup_results.get(cleanup_type, {"status": "error", "error": f"No {cleanup_type} cleanup has run"})
+    
     async def _analyze_memory_operation(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Handle memory analysis operations"""
         try:
@@ -220,6 +332,29 @@ class MemoryAgent(BaseAgent):
             logger.error(f"Memory analysis operation failed: {e}")
             return {"status": "error", "error": str(e)}
     
+    async def _record_operation(self, content: str, importance: float, metadata: Dict[str, Any]):
+        """Log a memory operation in the background, off the execute() path"""
+        await self._wait_until_below(MAX_PENDING_WRITES)
+        task = asyncio.create_task(self._bounded_store(content, importance, metadata))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _bounded_store(self, content: str, importance: float, metadata: Dict[str, Any]):
+        """Store an operation record, holding one of the concurrent write slots"""
+        async with self._write_sem:
+            await self.store_memory(content, "memory_operation", importance, metadata)
+    
+    async def _wait_until_below(self, limit: int):
+        """Wait for background tasks to finish until fewer than `limit` are pending"""
+        while len(self._background_tasks) >= limit:
+            await asyncio.wait(self._background_tasks, return_when=asyncio.FIRST_COMPLETED)
+    
+    async def cleanup(self):
+        """Wait for pending background writes and cleanups to finish"""
+        pending = [*self._background_tasks, *self._cleanup_tasks.values()]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    
     async def _update_memory_indexes(self, memory_id: str, content: str, 
                                    memory_type: str, metadata: Dict[str, Any]):
         """Update local memory indexes"""
@@ -260,21 +395,22 @@ class MemoryAgent(BaseAgent):
                                     filters: Dict[str, Any]) -> List[AgentMemory]:
         """Apply advanced filtering to memories"""
         try:
-            filtered_memories = memories
+            # Importance and date filters are combined into one mask over column arrays
+            mask = np.ones(len(memories), dtype=bool)
             
             # Filter by importance threshold
             if "min_importance" in filters:
-                min_importance = filters["min_importance"]
-                filtered_memories = [m for m in filtered_memories if m.importance_score >= min_importance]
+                importance = np.fromiter((m.importance_score for m in memories), dtype=np.float64, count=len(memories))
+                mask &= importance >= filters["min_importance"]
             
             # Filter by date range
             if "date_from" in filters and "date_to" in filters:
-                date_from = datetime.fromisoformat(filters["date_from"])
-                date_to = datetime.fromisoformat(filters["date_to"])
-                filtered_memories = [
-                    m for m in filtered_memories 
-                    if date_from <= m.created_at <= date_to
-                ]
+                date_from = datetime.fromisoformat(filters["date_from"]).timestamp()
+                date_to = datetime.fromisoformat(filters["date_to"]).timestamp()
+                created = np.fromiter((m.created_at.timestamp() for m in memories), dtype=np.float64, count=len(memories))
+                mask &= (created >= date_from) & (created <= date_to)
+            
+            filtered_memories = [memories[i] for i in np.flatnonzero(mask)]
             
             # Filter by metadata
             if "metadata_filters" in filters:
@@ -299,26 +435,35 @@ class MemoryAgent(BaseAgent):
             # Get all memories
             all_memories = await self.memory_manager.retrieve_memories("", "general", 1000)
             
-            # Categorize by type
-            categories = defaultdict(list)
-            for memory in all_memories:
-                categories[memory.memory_type].append(memory)
-            
-            # Generate category summaries
+            # Categorize by type: one type code per memory, then per-code counts and sums
             category_summaries = {}
-            for category, memories in categories.items():
-                category_summaries[category] = {
-                    "count": len(memories),
-                    "total_importance": sum(m.importance_score for m in memories),
-                    "avg_importance": sum(m.importance_score for m in memories) / len(memories) if memories else 0,
-                    "oldest": min(m.created_at for m in memories) if memories else None,
-                    "newest": max(m.created_at for m in memories) if memories else None
-                }
+            if all_memories:
+                count = len(all_memories)
+                importance = np.fromiter((m.importance_score for m in all_memories), dtype=np.float64, count=count)
+                created = np.fromiter((m.created_at.timestamp() for m in all_memories), dtype=np.float64, count=count)
+                categories, type_ids = np.unique([m.memory_type for m in all_memories], return_inverse=True)
+                counts = np.bincount(type_ids, minlength=len(categories))
+                totals = np.bincount(type_ids, weights=importance, minlength=len(categories))
+                
+                # Sorted by type then creation time, each category's oldest and newest bound its run
+                order = np.lexsort((created, type_ids))
+                ends = np.cumsum(counts)
+                starts = ends - counts
+                
+                # Generate category summaries
+                for i, category in enumerate(categories):
+                    category_summaries[str(category)] = {
+                        "count": int(counts[i]),
+                        "total_importance": float(totals[i]),
+                        "avg_importance": float(totals[i] / counts[i]),
+                        "oldest": all_memories[order[starts[i]]].created_at,
+                        "newest": all_memories[order[ends[i] - 1]].created_at
+                    }
             
             return {
                 "status": "success",
                 "operation": "categorize",
-                "categories": dict(category_summaries),
+                "categories": category_summaries,
                 "total_memories": len(all_memories)
             }
             
@@ -439,22 +584,22 @@ class MemoryAgent(BaseAgent):
             
             all_memories = await self.memory_manager.retrieve_memories("", "general", 1000)
             
-            # Simple duplicate detection (content-based)
-            content_map = {}
-            duplicates = []
+            # Exact-content duplicates: one set lookup per memory, no pairwise comparison.
+            # The content itself is the key, so hash collisions cannot merge distinct memories.
+            unique_contents = set()
+            duplicates = 0
             
             for memory in all_memories:
-                content_hash = hash(memory.content)
-                if content_hash in content_map:
-                    duplicates.append(memory)
+                if memory.content in unique_contents:
+                    duplicates += 1
                 else:
-                    content_map[content_hash] = memory
+                    unique_contents.add(memory.content)
             
             return {
                 "status": "success",
                 "operation": "cleanup_duplicates",
-                "duplicate_memories": len(duplicates),
-                "unique_memories": len(content_map)
+                "duplicate_memories": duplicates,
+                "unique_memories": len(unique_contents)
             }
             
         except Exception as e:
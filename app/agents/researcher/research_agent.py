@@ -7,15 +7,17 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import structlog
-from openai import OpenAI
 import os
 import google.generativeai as genai
 
-from app.core import BaseAgent, AgentType, AgentMemory
+from app.core import BaseAgent, AgentType, AgentMemory, get_openai_client
 from .tools import ResearchTools
 
 logger = structlog.get_logger()
 
+# Sources fetched and analyzed at the same time
+MAX_CONCURRENT_EXTRACTIONS = 8
+
 class ResearchAgent(BaseAgent):
     """Research Agent for gathering and analyzing information"""
     
@@ -26,7 +28,7 @@ class ResearchAgent(BaseAgent):
         api_key = os.getenv("OPENAI_API_KEY")
         gemini_api_key = os.getenv("GEMINI_API_KEY")
         if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
+            self.openai_client = get_openai_client(api_key)
         else:
             self.openai_client = None
             logger.warning("No OpenAI API key provided, using fallback mode")
@@ -123,29 +125,22 @@ class ResearchAgent(BaseAgent):
         try:
             logger.info(f"Analyzing {len(sources)} sources for topic: {topic}")
             
-            analyzed_sources = []
+            # Sources are fetched concurrently, at most MAX_CONCURRENT_EXTRACTIONS at a time
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+            completed = 0
             
-            for i, source in enumerate(sources):
+            async def analyze(source: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                nonlocal completed
                 try:
-                    await self.update_progress(0.5 + (i * 0.3 / len(sources)), f"Analyzing source {i+1}/{len(sources)}")
-                    
-                    # Extract content from source
-                    content = await self.research_tools.extract_content(source["url"])
+                    async with semaphore:
+                        # Extract content from source
+                        content = await self.research_tools.extract_content(source["url"])
                     
                     if content and len(content) > 100:  # Minimum content threshold
                         # Analyze content relevance
                         relevance_score = await self._analyze_content_relevance(content, topic)
                         
                         if relevance_score > 0.6:  # Relevance threshold
-                            analyzed_source = {
-                                **source,
-                                "content": content[:self.max_content_length],
-                                "relevance_score": relevance_score,
-                                "word_count": len(content.split()),
-                                "analyzed_at": datetime.utcnow().isoformat()
-                            }
-                            analyzed_sources.append(analyzed_source)
-                            
                             # Store source in memory
                             await self.store_memory(
                                 f"Source: {source['title']} - {content[:200]}...",
@@ -153,10 +148,24 @@ class ResearchAgent(BaseAgent):
                                 0.7,
                                 {"url": source["url"], "relevance": relevance_score}
                             )
+                            return {
+                                **source,
+                                "content": content[:self.max_content_length],
+                                "relevance_score": relevance_score,
+                                "word_count": len(content.split()),
+                                "analyzed_at": datetime.utcnow().isoformat()
+                            }
                     
                 except Exception as e:
                     logger.warning(f"Failed to analyze source {source.get('url', 'unknown')}: {e}")
-                    continue
+                finally:
+                    completed += 1
+                    await self.update_progress(0.5 + (completed * 0.3 / len(sources)), f"Analyzed source {completed}/{len(sources)}")
+                return None
+            
+            # Results come back in source order
+            results = await asyncio.gather(*(analyze(source) for source in sources))
+            analyzed_sources = [result for result in results if result is not None]
             
             logger.info(f"Successfully analyzed {len(analyzed_sources)} sources")
             return analyzed_sources
@@ -21,6 +21,11 @@ import arxiv
 
 logger = structlog.get_logger()
 
+# Connection pool of the shared HTTP session
+MAX_CONNECTIONS = 50
+MAX_CONNECTIONS_PER_HOST = 10
+DNS_CACHE_TTL = 300  # seconds
+
 class ResearchTools:
     """Tools for conducting research and content extraction using real APIs"""
     
@@ -40,10 +45,16 @@ class ResearchTools:
         logger.info("Research Tools initialized with real APIs")
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
+        """Get or create the aiohttp session shared by every request of these tools"""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            # Keep-alive connections and cached DNS lookups are reused across calls
+            connector = aiohttp.TCPConnector(
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL
+            )
+            self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self.session
     
     async def search_web(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
@@ -670,9 +681,9 @@ class ResearchTools:
     
     async def __aenter__(self):
         """Async context manager entry"""
+        await self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
         await self.close()
-        await self.close()
@@ -10,10 +10,54 @@ from textstat import textstat
 
 logger = structlog.get_logger()
 
+# Style and readability rewrites as (pattern, replacement) pairs, compiled once at import
+_PROFESSIONAL_RULES = [
+    # Remove contractions
+    (re.compile(r"n't\b"), " not"),
+    (re.compile(r"'re\b"), " are"),
+    (re.compile(r"'s\b"), " is"),
+    (re.compile(r"'ll\b"), " will")
+]
+_CASUAL_RULES = [
+    # Add contractions for readability
+    (re.compile(r" is not\b"), " isn't"),
+    (re.compile(r" are not\b"), " aren't"),
+    (re.compile(r" will not\b"), " won't"),
+    # Use active voice
+    (re.compile(r" is being\b"), " is"),
+    (re.compile(r" are being\b"), " are")
+]
+_ACADEMIC_RULES = [
+    # Ensure formal language
+    (re.compile(r"get\b"), "obtain"),
+    (re.compile(r"look at\b"), "examine"),
+    (re.compile(r"find out\b"), "determine"),
+    # Add academic transitions
+    (re.compile(r"\. "), ". Furthermore, ")
+]
+_READABILITY_RULES = [
+    (re.compile(r'\s+'), ' '),  # Remove extra whitespace
+    (re.compile(r'\.+'), '.'),  # Fix multiple periods
+    (re.compile(r',+'), ','),  # Fix multiple commas
+    (re.compile(r'([.!?])\s*([A-Z])'), r'\1 \2')  # Ensure proper spacing after punctuation
+]
+
+def _apply_rules(content: str, rules) -> str:
+    """Apply precompiled rewrite rules in order"""
+    for pattern, replacement in rules:
+        content = pattern.sub(replacement, content)
+    return content
+
 class WritingTools:
     """Tools for content writing, structuring, and optimization"""
     
     def __init__(self):
+        # Style rewrite per writing style, resolved once instead of branching on every call
+        self._style_appliers = {
+            "professional": self._apply_professional_style,
+            "casual": self._apply_casual_style,
+            "academic": self._apply_academic_style
+        }
         logger.info("WritingTools initialized")
     
     async def create_content_structure(self, topic: str, target_length: int, 
@@ -336,13 +380,10 @@ class WritingTools:
         try:
             logger.info(f"Optimizing content for {writing_style} style")
             
-            # Apply style-specific optimizations
-            if writing_style.lower() == "professional":
-                content = self._apply_professional_style(content)
-            elif writing_style.lower() == "casual":
-                content = self._apply_casual_style(content)
-            elif writing_style.lower() == "academic":
-                content = self._apply_academic_style(content)
+            # Apply style-specific optimizations; unknown styles are left as written
+            apply_style = self._style_appliers.get(writing_style.lower())
+            if apply_style:
+                content = apply_style(content)
             
             # Optimize length
             content = self._optimize_length(content, target_length)
@@ -360,11 +401,7 @@ class WritingTools:
     def _apply_professional_style(self, content: str) -> str:
         """Apply professional writing style"""
         try:
-            # Remove contractions
-            content = re.sub(r"n't\b", " not", content)
-            content = re.sub(r"'re\b", " are", content)
-            content = re.sub(r"'s\b", " is", content)
-            content = re.sub(r"'ll\b", " will", content)
+            content = _apply_rules(content, _PROFESSIONAL_RULES)
             
             # Ensure proper capitalization
             content = content.replace(" i ", " I ")
@@ -378,16 +415,7 @@ class WritingTools:
     def _apply_casual_style(self, content: str) -> str:
         """Apply casual writing style"""
         try:
-            # Add contractions for readability
-            content = re.sub(r" is not\b", " isn't", content)
-            content = re.sub(r" are not\b", " aren't", content)
-            content = re.sub(r" will not\b", " won't", content)
-            
-            # Use active voice
-            content = re.sub(r" is being\b", " is", content)
-            content = re.sub(r" are being\b", " are", content)
-            
-            return content
+            return _apply_rules(content, _CASUAL_RULES)
             
         except Exception as e:
             logger.error(f"Casual style application failed: {e}")
@@ -396,15 +424,7 @@ class WritingTools:
     def _apply_academic_style(self, content: str) -> str:
         """Apply academic writing style"""
         try:
-            # Ensure formal language
-            content = re.sub(r"get\b", "obtain", content)
-            content = re.sub(r"look at\b", "examine", content)
-            content = re.sub(r"find out\b", "determine", content)
-            
-            # Add academic transitions
-            content = re.sub(r"\. ", ". Furthermore, ", content)
-            
-            return content
+            return _apply_rules(content, _ACADEMIC_RULES)
             
         except Exception as e:
             logger.error(f"Academic style application failed: {e}")
@@ -436,15 +456,7 @@ class WritingTools:
     def _improve_readability(self, content: str) -> str:
         """Improve content readability"""
         try:
-            # Fix common issues
-            content = re.sub(r'\s+', ' ', content)  # Remove extra whitespace
-            content = re.sub(r'\.+', '.', content)  # Fix multiple periods
-            content = re.sub(r',+', ',', content)  # Fix multiple commas
-            
-            # Ensure proper spacing after punctuation
-            content = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', content)
-            
-            return content.strip()
+            return _apply_rules(content, _READABILITY_RULES).strip()
             
         except Exception as e:
             logger.error(f"Readability improvement failed: {e}")
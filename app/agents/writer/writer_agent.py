@@ -7,12 +7,11 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import structlog
-from openai import OpenAI
 import os
 import google.generativeai as genai # Import for Gemini fallback
 from functools import lru_cache # For caching LLM calls
 
-from app.core import BaseAgent, AgentType
+from app.core import BaseAgent, AgentType, get_openai_client
 from .tools import WritingTools
 
 logger = structlog.get_logger()
@@ -27,7 +26,7 @@ class WriterAgent(BaseAgent):
         api_key = os.getenv("OPENAI_API_KEY")
         gemini_api_key = os.getenv("GEMINI_API_KEY") # Get Gemini API key
         if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
+            self.openai_client = get_openai_client(api_key)
         else:
             self.openai_client = None
             logger.warning("No OpenAI API key provided, using fallback mode")
@@ -395,9 +394,10 @@ class WriterAgent(BaseAgent):
             target_length = content_plan.get("target_length", 1500)
             length_quality = min(1.0, content_length / target_length) if target_length > 0 else 0.5
             
-            # Basic readability (simple word count per sentence)
-            sentences = content.split('.')
-            avg_words_per_sentence = content_length / len(sentences) if sentences else 0
+            # Basic readability (simple word count per sentence).
+            # Counting the periods gives len(content.split('.')) without building the pieces.
+            sentence_count = content.count('.') + 1
+            avg_words_per_sentence = content_length / sentence_count
             readability_quality = 1.0 if 10 <= avg_words_per_sentence <= 25 else 0.7
             
             # Weighted average
@@ -4,16 +4,19 @@ Core Package for AI Agents System
 
 from .state_machine import WorkflowStateMachine, WorkflowContext, WorkflowState
 from .base_agent import BaseAgent, AgentStatus, AgentType, AgentMemory, AgentState
+from .openai_client import get_openai_client
 from .memory_manager import MemoryManager
 from .agent_communication import AgentCommunicationHub, AgentMessage, MessageType, MessagePriority
 from .workflow_orchestrator import WorkflowOrchestrator, OrchestratorStatus, WorkflowExecution
 from .workflow_persistence import WorkflowPersistence
+from .workflow_cache import WorkflowCache, workflow_cache
 
 __all__ = [
     "WorkflowStateMachine", "WorkflowContext", "WorkflowState",
     "BaseAgent", "AgentStatus", "AgentType", "AgentMemory", "AgentState",
-    "MemoryManager",
+    "get_openai_client", "MemoryManager",
     "AgentCommunicationHub", "AgentMessage", "MessageType", "MessagePriority",
     "WorkflowOrchestrator", "OrchestratorStatus", "WorkflowExecution",
-    "WorkflowPersistence"
+    "WorkflowPersistence",
+    "WorkflowCache", "workflow_cache"
 ] 
\ No newline at end of file
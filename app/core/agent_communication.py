@@ -136,6 +136,34 @@ class AgentCommunicationHub:
             logger.error(f"Failed to send message {message.id}: {e}")
             return False
     
+    async def send_many(self, messages: List[AgentMessage]) -> int:
+        """Send several messages in one pass, returning how many were queued
+        
+        Queues are unbounded, so every put completes without yielding to the
+        event loop and the whole batch lands before any receiver runs.
+        """
+        try:
+            now = datetime.utcnow()
+            sent_count = 0
+            
+            for message in messages:
+                queue = self.message_queues.get(message.recipient_id)
+                if queue is None:
+                    logger.warning(f"Recipient agent {message.recipient_id} not found")
+                    continue
+                if message.expires_at and now > message.expires_at:
+                    logger.warning(f"Message {message.id} has expired")
+                    continue
+                queue.put_nowait(message)
+                sent_count += 1
+            
+            logger.debug(f"Sent {sent_count} of {len(messages)} messages")
+            return sent_count
+            
+        except Exception as e:
+            logger.error(f"Failed to send messages: {e}")
+            return 0
+    
     async def broadcast_message(self, message: AgentMessage, 
                               exclude_sender: bool = True) -> int:
         """Broadcast a message to all registered agents"""
@@ -167,8 +195,8 @@ class AgentCommunicationHub:
             logger.error(f"Failed to broadcast message: {e}")
             return 0
     
-    async def get_messages(self, agent_id: str, timeout: float = 1.0) -> List[AgentMessage]:
-        """Get all pending messages for an agent"""
+    async def get_messages(self, agent_id: str) -> List[AgentMessage]:
+        """Get all pending messages for an agent without waiting for new ones"""
         try:
             if agent_id not in self.message_queues:
                 return []
@@ -176,13 +204,10 @@ class AgentCommunicationHub:
             messages = []
             queue = self.message_queues[agent_id]
             
-            # Get all available messages
+            # Get all available messages; a non-empty queue never blocks, so
+            # take them directly instead of wrapping each get in a wait_for task
             while not queue.empty():
-                try:
-                    message = await asyncio.wait_for(queue.get(), timeout=timeout)
-                    messages.append(message)
-                except asyncio.TimeoutError:
-                    break
+                messages.append(queue.get_nowait())
             
             return messages
             
@@ -258,7 +283,7 @@ class AgentCommunicationHub:
                     if not handlers:
                         continue
                     
-                    messages = await self.get_messages(agent_id, timeout=0.1)
+                    messages = await self.get_messages(agent_id)
                     
                     for message in messages:
                         # Call all handlers for the agent
@@ -22,6 +22,9 @@ AGENT_EXECUTIONS = Counter("agent_executions_total", "Total agent executions", [
 AGENT_COMPLETIONS = Counter("agent_completions_total", "Total agent completions", ["agent_type"])
 AGENT_ERRORS = Counter("agent_errors_total", "Total agent errors", ["agent_type"])
 
+# Memories fetched per query when iterating with iter_memories
+MEMORY_PAGE_SIZE = 50
+
 class AgentStatus(str, Enum):
     """Agent status enumeration"""
     IDLE = "idle"
@@ -241,8 +244,28 @@ class BaseAgent(ABC):
             logger.error(f"Failed to store memory for agent {self.name}: {e}")
             return ""
     
+    async def store_memory_batch(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Store several memories in one session, one embedding request and one commit.
+        
+        Each item takes the keyword arguments of store_memory: content and optionally
+        memory_type, importance_score and metadata.
+        """
+        try:
+            from app.core.memory_manager import MemoryManager
+            from app.database.connection import get_db_session
+            
+            async with get_db_session() as session:
+                memory_manager = MemoryManager(session)
+                memory_ids = await memory_manager.store_memories(items, agent_id=self.agent_id)
+                logger.debug(f"Agent {self.name} stored {len(memory_ids)} memories")
+                return memory_ids
+                
+        except Exception as e:
+            logger.error(f"Failed to store memories for agent {self.name}: {e}")
+            return []
+    
     async def retrieve_memories(self, query: str = None, memory_type: str = None, 
-                              limit: int = 10) -> List[AgentMemory]:
+                              limit: int = 10, offset: int = 0) -> List[AgentMemory]:
         """Retrieve memories from the database"""
         try:
             from app.core.memory_manager import MemoryManager
@@ -255,7 +278,8 @@ class BaseAgent(ABC):
                 db_memories = await memory_manager.retrieve_memories(
                     query=query,
                     memory_type=memory_type,
-                    limit=limit
+                    limit=limit,
+                    offset=offset
                 )
                 
                 # Convert to AgentMemory objects
@@ -277,6 +301,26 @@ class BaseAgent(ABC):
             logger.error(f"Failed to retrieve memories for agent {self.name}: {e}")
             return []
     
+    async def iter_memories(self, query: str = None, memory_type: str = None,
+                            page_size: int = MEMORY_PAGE_SIZE):
+        """Yield memories page by page, fetching the next page while the current one is consumed"""
+        offset = 0
+        next_page = asyncio.create_task(self.retrieve_memories(query, memory_type, page_size, offset))
+        try:
+            while next_page is not None:
+                page = await next_page
+                offset += page_size
+                # A short page is the last one
+                next_page = None
+                if len(page) == page_size:
+                    next_page = asyncio.create_task(self.retrieve_memories(query, memory_type, page_size, offset))
+                for memory in page:
+                    yield memory
+        finally:
+            # The caller stopped early; drop the prefetch in flight
+            if next_page is not None:
+                next_page.cancel()
+    
     async def retrieve_similar_memories(self, query: str, limit: int = 5, 
                                       similarity_threshold: float = 0.7) -> List[AgentMemory]:
         """Retrieve similar memories using vector similarity search"""
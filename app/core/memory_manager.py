@@ -5,19 +5,57 @@ Handles vector storage and retrieval of agent memories
 
 import hashlib
 import json
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import structlog
 import numpy as np
-from openai import OpenAI
 import os
 
 logger = structlog.get_logger()
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, text
 from app.database.models import AgentMemory, ContentEmbedding
+from app.core.openai_client import get_openai_client
+
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+# Statements on the store/lookup paths, built once and executed with bound parameters
+_SELECT_EXISTING_HASHES = (
+    select(ContentEmbedding.content_hash)
+    .where(ContentEmbedding.content_hash.in_(bindparam("hashes", expanding=True)))
+)
+_SELECT_MEMORY_BY_ID = select(AgentMemory).where(AgentMemory.id == bindparam("memory_id"))
+
+# Default hnsw.ef_search for similarity queries (pgvector's own default)
+# and the largest value pgvector accepts
+HNSW_EF_SEARCH = 40
+HNSW_MAX_EF_SEARCH = 1000
+
+# Embeddings by content hash, shared by every MemoryManager in the process.
+# Agents open a new manager per call, so this is what lets repeated queries
+# and contents skip the embedding request.
+EMBEDDING_CACHE_SIZE = 1024
+_embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+_embedding_cache_stats = {"hits": 0, "misses": 0}
+
+def _cache_embedding(content_hash: str, embedding: List[float]):
+    """Remember an embedding, dropping the least recently used beyond the cache size"""
+    _embedding_cache[content_hash] = embedding
+    _embedding_cache.move_to_end(content_hash)
+    if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+        _embedding_cache.popitem(last=False)
+
+def embedding_cache_stats() -> Dict[str, Any]:
+    """Hit counts of the process-wide embedding cache"""
+    lookups = sum(_embedding_cache_stats.values())
+    return {
+        **_embedding_cache_stats,
+        "size": len(_embedding_cache),
+        "hit_rate": _embedding_cache_stats["hits"] / lookups if lookups else 0.0
+    }
 
 class MemoryManager:
     """Manages vector storage and retrieval of agent memories with DB integration"""
@@ -26,7 +64,7 @@ class MemoryManager:
         self.db_session = db_session
         api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
         if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
+            self.openai_client = get_openai_client(api_key)
         else:
             self.openai_client = None
             logger.warning("No OpenAI API key provided, using fallback embedding mode")
@@ -37,24 +75,65 @@ class MemoryManager:
         """Generate a hash for content to avoid duplicates"""
         return hashlib.sha256(content.encode()).hexdigest()
     
-    async def _generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for text using OpenAI"""
+    async def _generate_embedding(self, text: str, content_hash: str = None) -> List[float]:
+        """Generate embedding for text using OpenAI; pass content_hash if already computed"""
         try:
+            content_hash = content_hash or self._generate_content_hash(text)
+            if content_hash in _embedding_cache:
+                _embedding_cache_stats["hits"] += 1
+                _embedding_cache.move_to_end(content_hash)
+                return _embedding_cache[content_hash]
+            _embedding_cache_stats["misses"] += 1
+            
             if not self.openai_client:
                 # Fallback: generate random embedding
                 logger.warning("Using fallback embedding generation")
                 return np.random.randn(1536).tolist()
             
             response = self.openai_client.embeddings.create(
-                model="text-embedding-ada-002",
+                model=EMBEDDING_MODEL,
                 input=text
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+            _cache_embedding(content_hash, embedding)
+            return embedding
             
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             return np.random.randn(1536).tolist()
     
+    async def _generate_embeddings(self, texts: List[str], hashes: List[str] = None) -> List[List[float]]:
+        """Generate embeddings for several texts with one OpenAI request; pass hashes if already computed"""
+        try:
+            hashes = hashes or [self._generate_content_hash(text) for text in texts]
+            embeddings = [_embedding_cache.get(content_hash) for content_hash in hashes]
+            _embedding_cache_stats["hits"] += sum(embedding is not None for embedding in embeddings)
+            
+            # Only texts not embedded before go to the API
+            missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            _embedding_cache_stats["misses"] += len(missing)
+            
+            if missing:
+                if not self.openai_client:
+                    logger.warning("Using fallback embedding generation")
+                    return [embedding or np.random.randn(1536).tolist() for embedding in embeddings]
+                
+                response = self.openai_client.embeddings.create(
+                    model=EMBEDDING_MODEL,
+                    input=[texts[i] for i in missing]
+                )
+                # The API may return items out of order; each carries its input index
+                for item in response.data:
+                    i = missing[item.index]
+                    embeddings[i] = item.embedding
+                    _cache_embedding(hashes[i], item.embedding)
+            
+            return embeddings
+            
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings: {e}")
+            return [np.random.randn(1536).tolist() for _ in texts]
+    
     async def store_memory(self, content: str, memory_type: str = "general", 
                           importance_score: float = 0.5, metadata: Dict[str, Any] = None,
                           agent_id: str = None) -> str:
@@ -63,16 +142,13 @@ class MemoryManager:
             content_hash = self._generate_content_hash(content)
             
             # Check if memory already exists in DB
-            query = await self.db_session.execute(
-                select(ContentEmbedding).where(ContentEmbedding.content_hash == content_hash)
-            )
-            existing_embedding = query.scalar_one_or_none()
-            if existing_embedding:
+            query = await self.db_session.execute(_SELECT_EXISTING_HASHES, {"hashes": [content_hash]})
+            if query.first() is not None:
                 logger.debug(f"Memory already exists in DB with hash: {content_hash}")
                 return content_hash
             
             # Generate embedding
-            embedding = await self._generate_embedding(content)
+            embedding = await self._generate_embedding(content, content_hash)
             
             # Create ContentEmbedding record
             content_embedding = ContentEmbedding(
@@ -102,8 +178,57 @@ class MemoryManager:
             await self.db_session.rollback()
             return ""
     
+    async def store_memories(self, items: List[Dict[str, Any]], agent_id: str = None) -> List[str]:
+        """Store several memories with one embedding request and one commit"""
+        try:
+            # Each content is hashed once; the hashes are both the dedup keys and the result
+            hashes = [self._generate_content_hash(item["content"]) for item in items]
+            
+            # Unique contents in input order; duplicates within the batch are stored once
+            pending = {}
+            for content_hash, item in zip(hashes, items):
+                pending.setdefault(content_hash, item)
+            
+            # Skip memories already in DB with a single lookup
+            query = await self.db_session.execute(_SELECT_EXISTING_HASHES, {"hashes": list(pending)})
+            for content_hash in query.scalars().all():
+                logger.debug(f"Memory already exists in DB with hash: {content_hash}")
+                del pending[content_hash]
+            
+            if pending:
+                embeddings = await self._generate_embeddings(
+                    [item["content"] for item in pending.values()], list(pending)
+                )
+                
+                records = []
+                for (content_hash, item), embedding in zip(pending.items(), embeddings):
+                    records.append(ContentEmbedding(
+                        content_hash=content_hash,
+                        content_text=item["content"],
+                        embedding=embedding,
+                        content_metadata=item.get("metadata") or {}
+                    ))
+                    records.append(AgentMemory(
+                        agent_id=agent_id,
+                        memory_type=item.get("memory_type", "general"),
+                        content=item["content"],
+                        importance_score=item.get("importance_score", 0.5)
+                    ))
+                self.db_session.add_all(records)
+                
+                await self.db_session.commit()
+            
+            logger.info(f"Stored {len(pending)} memories in DB ({len(items)} requested)")
+            return hashes
+            
+        except Exception as e:
+            logger.error(f"Failed to store memories in DB: {e}")
+            await self.db_session.rollback()
+            return []
+    
     async def retrieve_memories(self, query: str = "", memory_type: str = "general", 
-                               limit: int = 10, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+                               limit: int = 10, filters: Dict[str, Any] = None,
+                               offset: int = 0) -> List[Dict[str, Any]]:
         """Retrieve memories based on query and filters"""
         try:
             stmt = select(AgentMemory)
@@ -114,7 +239,8 @@ class MemoryManager:
             if filters:
                 for key, value in filters.items():
                     stmt = stmt.where(getattr(AgentMemory, key) == value)
-            stmt = stmt.limit(limit)
+            # Most recent first; the id breaks ties so offset pages stay stable
+            stmt = stmt.order_by(AgentMemory.created_at.desc(), AgentMemory.id).offset(offset).limit(limit)
             
             result = await self.db_session.execute(stmt)
             memories = result.scalars().all()
@@ -142,68 +268,47 @@ class MemoryManager:
                                       limit: int = 10, similarity_threshold: float = 0.7) -> List[Dict[str, Any]]:
         """Retrieve memories similar to the query using vector similarity"""
         try:
+            if limit <= 0:
+                return []
+            
             # Generate embedding for query
             query_embedding = await self._generate_embedding(query)
             
-            # Get all content embeddings from database
-            stmt = select(ContentEmbedding)
+            # The HNSW index only yields ef_search candidates, so widen it for large limits
+            ef_search = min(HNSW_MAX_EF_SEARCH, max(HNSW_EF_SEARCH, int(limit)))
+            await self.db_session.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+            
+            # Nearest neighbours by cosine distance, served by the HNSW index on content_embeddings
+            distance = ContentEmbedding.embedding.cosine_distance(query_embedding)
+            stmt = (
+                select(ContentEmbedding, distance.label("distance"))
+                .where(ContentEmbedding.embedding.is_not(None))
+                .order_by(distance)
+                .limit(limit)
+            )
             result = await self.db_session.execute(stmt)
-            embeddings = result.scalars().all()
-            
-            if not embeddings:
-                return []
             
-            # Calculate similarities
             similarities = []
-            for embedding_record in embeddings:
-                try:
-                    # Calculate cosine similarity
-                    similarity = self._cosine_similarity(query_embedding, embedding_record.embedding)
-                    
-                    if similarity >= similarity_threshold:
-                        similarities.append({
-                            "content_hash": embedding_record.content_hash,
-                            "similarity": similarity,
-                            "content": embedding_record.content_text,
-                            "metadata": embedding_record.content_metadata,
-                            "created_at": embedding_record.created_at.isoformat() if embedding_record.created_at else None
-                        })
-                except Exception as e:
-                    logger.warning(f"Failed to process embedding: {e}")
-                    continue
-            
-            # Sort by similarity and return top results
-            similarities.sort(key=lambda x: x["similarity"], reverse=True)
-            
-            result = similarities[:limit]
-            logger.info(f"Retrieved {len(result)} similar memories for query")
-            return result
+            for embedding_record, embedding_distance in result.all():
+                similarity = 1.0 - float(embedding_distance)
+                # Rows come back nearest first, so everything after this is below the threshold too
+                if similarity < similarity_threshold:
+                    break
+                similarities.append({
+                    "content_hash": embedding_record.content_hash,
+                    "similarity": similarity,
+                    "content": embedding_record.content_text,
+                    "metadata": embedding_record.content_metadata,
+                    "created_at": embedding_record.created_at.isoformat() if embedding_record.created_at else None
+                })
+            
+            logger.info(f"Retrieved {len(similarities)} similar memories for query")
+            return similarities
             
         except Exception as e:
             logger.error(f"Failed to retrieve similar memories: {e}")
             return []
     
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """Calculate cosine similarity between two vectors"""
-        try:
-            vec1_array = np.array(vec1)
-            vec2_array = np.array(vec2)
-            
-            # Normalize vectors
-            norm1 = np.linalg.norm(vec1_array)
-            norm2 = np.linalg.norm(vec2_array)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            # Calculate cosine similarity
-            similarity = np.dot(vec1_array, vec2_array) / (norm1 * norm2)
-            return float(similarity)
-            
-        except Exception as e:
-            logger.error(f"Failed to calculate cosine similarity: {e}")
-            return 0.0
-    
     async def search_memories(self, query: str, memory_type: str = None, 
                             limit: int = 10) -> List[Dict[str, Any]]:
         """Search memories by text content"""
@@ -212,8 +317,7 @@ class MemoryManager:
     async def get_memory(self, memory_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific memory by ID"""
         try:
-            stmt = select(AgentMemory).where(AgentMemory.id == memory_id)
-            result = await self.db_session.execute(stmt)
+            result = await self.db_session.execute(_SELECT_MEMORY_BY_ID, {"memory_id": memory_id})
             memory = result.scalar_one_or_none()
             if memory:
                 return {
@@ -232,8 +336,7 @@ class MemoryManager:
     async def update_memory(self, memory_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing memory"""
         try:
-            stmt = select(AgentMemory).where(AgentMemory.id == memory_id)
-            result = await self.db_session.execute(stmt)
+            result = await self.db_session.execute(_SELECT_MEMORY_BY_ID, {"memory_id": memory_id})
             memory = result.scalar_one_or_none()
             
             if memory:
@@ -256,8 +359,7 @@ class MemoryManager:
     async def delete_memory(self, memory_id: str) -> bool:
         """Delete a memory"""
         try:
-            stmt = select(AgentMemory).where(AgentMemory.id == memory_id)
-            result = await self.db_session.execute(stmt)
+            result = await self.db_session.execute(_SELECT_MEMORY_BY_ID, {"memory_id": memory_id})
             memory = result.scalar_one_or_none()
 
             if memory:
@@ -292,10 +394,17 @@ class MemoryManager:
             )
             memory_types = {row[0]: row[1] for row in memory_types_query.all()}
             
+            # Whether similarity search is backed by the HNSW index
+            ann_index_query = await self.db_session.execute(
+                text("SELECT 1 FROM pg_indexes WHERE indexname = 'idx_content_embeddings_ann'")
+            )
+            
             return {
                 "total_memories": total_memories,
                 "memory_types": memory_types,
-                "total_embeddings": total_embeddings
+                "total_embeddings": total_embeddings,
+                "ann_index": ann_index_query.first() is not None,
+                "embedding_cache": embedding_cache_stats()
             }
             
         except Exception as e:
@@ -0,0 +1,16 @@
+"""
+Shared OpenAI client for AI Agents System
+Lets every agent and memory manager reuse one connection pool
+"""
+
+from functools import lru_cache
+from openai import OpenAI
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for an API key, creating it on first use
+    
+    The client is thread-safe, and sharing it keeps TCP and TLS connections
+    alive across agents instead of each building its own pool.
+    """
+    return OpenAI(api_key=api_key)
@@ -0,0 +1,131 @@
+"""
+Workflow Cache for AI Agents System
+Reuses sub-agent phase results across coordinator runs
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+import structlog
+
+logger = structlog.get_logger()
+
+# Weights of the eviction score: recency, predicted reuse, hit frequency
+RECENCY_WEIGHT = 0.3
+REUSE_WEIGHT = 0.5
+FREQUENCY_WEIGHT = 0.2
+
+DEFAULT_MAX_ENTRIES = 128
+
+@dataclass
+class CacheEntry:
+    """Cached result of one workflow phase"""
+    phase: str
+    value: Dict[str, Any]
+    last_access: int = 0
+    hits: int = 0
+
+class WorkflowCache:
+    """Workflow-aware LRU cache of phase results keyed by (phase, context)
+
+    When full, the entry with the lowest weighted score of recency, hit
+    frequency and the probability that its phase is requested next is
+    evicted. That probability comes from the phase-to-phase transitions
+    seen in lookups, so results of the phase the workflow is heading
+    into outlive ones it has just left.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: Dict[str, CacheEntry] = {}
+        self.transitions: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.last_phase: Optional[str] = None
+        self.clock = 0
+        self.hits = 0
+        self.misses = 0
+        # Callers are coroutines on one event loop, and no method awaits, so each
+        # call already runs uninterrupted; the lock only matters for worker threads
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(phase: str, context: Dict[str, Any]) -> str:
+        """SHA-256 of the phase name and the key-sorted context"""
+        normalized = json.dumps(context, sort_keys=True, default=str)
+        return hashlib.sha256(f"{phase}\0{normalized}".encode()).hexdigest()
+
+    def get(self, key: str, phase: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None on a miss"""
+        with self._lock:
+            self._record_transition(phase)
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.clock += 1
+            entry.last_access = self.clock
+            entry.hits += 1
+            self.hits += 1
+            # Callers mutate phase results, so never hand out the cached dict
+            return copy.deepcopy(entry.value)
+
+    def put(self, key: str, phase: str, value: Dict[str, Any]):
+        """Cache a phase result, evicting the lowest-scoring entry when full"""
+        with self._lock:
+            if key not in self.entries and len(self.entries) >= self.max_entries:
+                self._evict()
+            self.clock += 1
+            self.entries[key] = CacheEntry(phase=phase, value=copy.deepcopy(value), last_access=self.clock)
+
+    def clear(self):
+        """Drop all cached results, transition statistics and hit counts"""
+        with self._lock:
+            self.entries.clear()
+            self.transitions.clear()
+            self.last_phase = None
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit statistics"""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def _record_transition(self, phase: str):
+        """Count the transition from the previously requested phase"""
+        if self.last_phase is not None:
+            self.transitions[(self.last_phase, phase)] += 1
+        self.last_phase = phase
+
+    def _reuse_probability(self, phase: str) -> float:
+        """Estimate P(next phase is `phase`) from the transitions out of the current phase"""
+        outgoing = {nxt: count for (prev, nxt), count in self.transitions.items() if prev == self.last_phase}
+        total = sum(outgoing.values())
+        return outgoing.get(phase, 0) / total if total else 0.0
+
+    def _evict(self):
+        """Evict the entry with the lowest workflow-aware score"""
+        oldest = min(entry.last_access for entry in self.entries.values())
+        span = max(self.clock - oldest, 1)
+        max_hits = max(max(entry.hits for entry in self.entries.values()), 1)
+        reuse = {phase: self._reuse_probability(phase) for phase in {entry.phase for entry in self.entries.values()}}
+
+        def score(entry: CacheEntry) -> float:
+            recency = (entry.last_access - oldest) / span
+            return (RECENCY_WEIGHT * recency
+                    + REUSE_WEIGHT * reuse[entry.phase]
+                    + FREQUENCY_WEIGHT * entry.hits / max_hits)
+
+        key = min(self.entries, key=lambda k: score(self.entries[k]))
+        logger.debug(f"Evicting {self.entries[key].phase} result from workflow cache")
+        del self.entries[key]
+
+# Shared by every coordinator in the process so separate runs reuse each other's results
+workflow_cache = WorkflowCache()
@@ -55,6 +55,8 @@ class WorkflowOrchestrator:
         self.communication_hub = AgentCommunicationHub()
         self.agents: Dict[str, BaseAgent] = {}
         self.workflows: Dict[str, WorkflowExecution] = {}
+        # Set when a workflow's background run ends or it is cancelled
+        self._completion_events: Dict[str, asyncio.Event] = {}
         self.status = OrchestratorStatus.IDLE
         self.max_retries = 3
         self.retry_delay = 5.0  # seconds
@@ -150,14 +152,17 @@ class WorkflowOrchestrator:
             )
             
             self.workflows[execution_id] = workflow_execution
+            self._completion_events[execution_id] = asyncio.Event()
 
             # Prometheus: increment workflow starts
             WORKFLOW_STARTS.inc()
 
-            # Start workflow execution in background with tracing and duration histogram
-            asyncio.create_task(self._execute_workflow_background_traced(
+            # Start workflow execution in background with tracing and duration histogram;
+            # however the run ends (completed, failed after retries, cancelled), wake waiters
+            task = asyncio.create_task(self._execute_workflow_background_traced(
                 execution_id, topic, target_length, quality_threshold
             ))
+            task.add_done_callback(lambda _: self._signal_completion(execution_id))
             
             logger.info(f"Started workflow execution: {execution_id}")
             return execution_id
@@ -272,6 +277,7 @@ class WorkflowOrchestrator:
             workflow = self.workflows[execution_id]
             workflow.status = "cancelled"
             workflow.end_time = datetime.utcnow()
+            self._signal_completion(execution_id)
             
             logger.info(f"Workflow {execution_id} cancelled")
             return True
@@ -280,6 +286,32 @@ class WorkflowOrchestrator:
             logger.error(f"Failed to cancel workflow {execution_id}: {e}")
             return False
     
+    def _signal_completion(self, execution_id: str):
+        """Wake waiters of a workflow and forget its event, so finished runs leave nothing behind"""
+        event = self._completion_events.pop(execution_id, None)
+        if event is not None:
+            event.set()
+    
+    async def wait_for_completion(self, execution_id: str, timeout: float = None) -> bool:
+        """Wait until a workflow's run ends or it is cancelled
+        
+        Returns False if the workflow is unknown or still running after timeout seconds.
+        """
+        try:
+            event = self._completion_events.get(execution_id)
+            if event is None:
+                # Events are dropped once a run ends, so a known workflow without one is done
+                if execution_id in self.workflows:
+                    return True
+                logger.warning(f"Workflow {execution_id} not found")
+                return False
+            
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+            
+        except asyncio.TimeoutError:
+            return False
+    
     async def get_workflow_status(self, execution_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a workflow execution"""
         try:
@@ -1,213 +1,347 @@
 """
 Workflow Persistence System for AI Agents System
 Handles saving and loading workflow states, progress, and results
+in a single SQLite database (WAL mode) under the storage path
 """
 
+import asyncio
 import json
-import os
-from typing import Dict, Any, List, Optional
+import sqlite3
+from contextlib import closing
+from typing import Dict, Any, List, Optional, AsyncIterator
 from datetime import datetime
 import structlog
-import uuid
+import orjson
+import zstandard
 from pathlib import Path
 
 logger = structlog.get_logger()
 
+# Statuses with their own bucket in the statistics; anything else counts as "active"
+STATUS_DIRS = ("active", "completed", "failed", "archived")
+
+DATABASE_FILENAME = "workflows.db"
+
+# Workflow headers fetched per query when listing
+LIST_PAGE_SIZE = 100
+
+# Archived states are rarely read, so they are stored zstd-compressed
+ARCHIVE_COMPRESSION_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Expired workflows deleted per transaction during cleanup
+CLEANUP_BATCH_SIZE = 500
+
+# States may hold numpy values (embeddings, scores) and non-string dict keys,
+# which json.dumps coerced and orjson rejects unless asked
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    saved_at TEXT NOT NULL,
+    updated_at TEXT,
+    state BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_workflows_status_saved ON workflows(status, saved_at DESC);
+CREATE INDEX IF NOT EXISTS idx_workflows_saved ON workflows(saved_at DESC);
+"""
+
 class WorkflowPersistence:
     """Manages workflow state persistence and recovery"""
     
     def __init__(self, storage_path: str = "workflow_states"):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
+        self.db_path = self.storage_path / DATABASE_FILENAME
+        
+        with closing(self._connect()) as conn:
+            # WAL is persistent in the database file, so it only needs setting once
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
         
-        # Ensure subdirectories exist
-        (self.storage_path / "active").mkdir(exist_ok=True)
-        (self.storage_path / "completed").mkdir(exist_ok=True)
-        (self.storage_path / "failed").mkdir(exist_ok=True)
-        (self.storage_path / "archived").mkdir(exist_ok=True)
+        # Import workflows saved by the previous file-per-workflow layout
+        migrated = self._migrate_json_files()
+        if migrated:
+            logger.info(f"Migrated {migrated} workflow files into {self.db_path}")
         
         logger.info(f"Workflow persistence initialized at {self.storage_path}")
     
-    async def save_workflow_state(self, workflow_id: str, state: Dict[str, Any], 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the workflow database (blocking)"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+    
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """Run a write statement in its own transaction (blocking)
+        
+        Returns the number of affected rows.
+        """
+        with closing(self._connect()) as conn, conn:
+            return conn.execute(sql, params).rowcount
+    
+    def _fetch(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Run a query and return all rows (blocking)"""
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, params).fetchall()
+    
+    def _encode_state(self, state: Dict[str, Any]) -> bytes:
+        """Serialize a workflow state for the state column"""
+        return orjson.dumps(state, default=str, option=_ORJSON_OPTIONS)
+    
+    def _decode_state(self, payload: bytes) -> Dict[str, Any]:
+        """Deserialize a state column value, decompressing archived states"""
+        if payload[:4] == _ZSTD_MAGIC:
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+        return orjson.loads(payload)
+    
+    def _row_to_record(self, row: tuple) -> Dict[str, Any]:
+        """Convert a (id, status, saved_at, updated_at, state) row into a workflow record"""
+        workflow_id, status, saved_at, updated_at, state = row
+        record = {
+            "workflow_id": workflow_id,
+            "status": status,
+            "saved_at": saved_at,
+            "state": self._decode_state(state)
+        }
+        if updated_at:
+            record["updated_at"] = updated_at
+        return record
+    
+    def _migrate_json_files(self) -> int:
+        """Move workflows from the legacy <status>/<workflow_id>.json files into the database (blocking)
+        
+        Returns the number of migrated workflows.
+        """
+        migrated = 0
+        for status_dir in STATUS_DIRS:
+            dir_path = self.storage_path / status_dir
+            if not dir_path.is_dir():
+                continue
+            
+            for file_path in dir_path.glob("*.json"):
+                try:
+                    with open(file_path, 'r') as f:
+                        workflow_data = json.load(f)
+                    
+                    # Status updates were written to a small sidecar next to the payload
+                    meta_path = file_path.with_suffix(".meta")
+                    if meta_path.exists():
+                        with open(meta_path, 'r') as f:
+                            workflow_data.update(json.load(f))
+                    
+                    self._execute(
+                        "INSERT OR REPLACE INTO workflows (id, status, saved_at, updated_at, state) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            workflow_data.get("workflow_id", file_path.stem),
+                            workflow_data.get("status", status_dir),
+                            workflow_data.get("saved_at") or datetime.now().isoformat(),
+                            workflow_data.get("updated_at"),
+                            self._encode_state(workflow_data.get("state", {}))
+                        )
+                    )
+                    file_path.unlink()
+                    meta_path.unlink(missing_ok=True)
+                    migrated += 1
+                
+                except Exception as e:
+                    logger.error(f"Failed to migrate workflow file {file_path}: {e}")
+        
+        return migrated
+    
+    async def save_workflow_state(self, workflow_id: str, state: Dict[str, Any],
                                 status: str = "active") -> bool:
-        """Save workflow state to disk"""
+        """Save workflow state to the database"""
         try:
-            # Add metadata
-            state_data = {
-                "workflow_id": workflow_id,
-                "status": status,
-                "saved_at": datetime.now().isoformat(),
-                "state": state
-            }
-            
-            # Determine file path based on status
-            if status == "completed":
-                file_path = self.storage_path / "completed" / f"{workflow_id}.json"
-            elif status == "failed":
-                file_path = self.storage_path / "failed" / f"{workflow_id}.json"
-            elif status == "archived":
-                file_path = self.storage_path / "archived" / f"{workflow_id}.json"
-            else:
-                file_path = self.storage_path / "active" / f"{workflow_id}.json"
-            
-            # Save to file
-            with open(file_path, 'w') as f:
-                json.dump(state_data, f, indent=2, default=str)
+            await asyncio.to_thread(
+                self._execute,
+                "INSERT OR REPLACE INTO workflows (id, status, saved_at, updated_at, state) "
+                "VALUES (?, ?, ?, NULL, ?)",
+                (workflow_id, status, datetime.now().isoformat(), self._encode_state(state))
+            )
             
             logger.info(f"Saved workflow state: {workflow_id} ({status})")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to save workflow state {workflow_id}: {e}")
             return False
     
     async def load_workflow_state(self, workflow_id: str) -> Optional[Dict[str, Any]]:
-        """Load workflow state from disk"""
+        """Load workflow state from the database"""
         try:
-            # Search in all directories
-            for status_dir in ["active", "completed", "failed", "archived"]:
-                file_path = self.storage_path / status_dir / f"{workflow_id}.json"
-                if file_path.exists():
-                    with open(file_path, 'r') as f:
-                        state_data = json.load(f)
-                    
-                    logger.info(f"Loaded workflow state: {workflow_id} ({state_data.get('status')})")
-                    return state_data
+            rows = await asyncio.to_thread(
+                self._fetch,
+                "SELECT id, status, saved_at, updated_at, state FROM workflows WHERE id = ?",
+                (workflow_id,)
+            )
+            if rows:
+                state_data = self._row_to_record(rows[0])
+                
+                logger.info(f"Loaded workflow state: {workflow_id} ({state_data.get('status')})")
+                return state_data
             
             logger.warning(f"Workflow state not found: {workflow_id}")
             return None
-            
+        
         except Exception as e:
             logger.error(f"Failed to load workflow state {workflow_id}: {e}")
             return None
     
-    async def list_workflows(self, status: str = None) -> List[Dict[str, Any]]:
-        """List all workflows or workflows of a specific status"""
+    def _fetch_header_page(self, status: Optional[str], last_key: Optional[tuple],
+                           page_size: int) -> List[tuple]:
+        """Fetch one page of workflow headers after last_key (blocking)"""
+        conditions = ["status = ?"] if status else []
+        params = (status,) if status else ()
+        if last_key:
+            conditions.append("(saved_at, id) < (?, ?)")
+            params += last_key
+        clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        return self._fetch(
+            f"SELECT id, status, saved_at, updated_at FROM workflows {clause} "
+            "ORDER BY saved_at DESC, id DESC LIMIT ?",
+            params + (page_size,)
+        )
+    
+    async def iter_workflows(self, status: str = None,
+                             limit: int = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield workflow headers, newest first, one page at a time
+        
+        Only LIST_PAGE_SIZE headers are held in memory at once. Pages are read
+        with keyset pagination on (saved_at, id), so each page is an index seek,
+        and the next page is prefetched in a worker thread while the caller
+        consumes the current one.
+        """
+        if limit is not None and limit <= 0:
+            return
+        
+        page_size = LIST_PAGE_SIZE if limit is None else min(LIST_PAGE_SIZE, limit)
+        remaining = limit
+        next_page = asyncio.create_task(asyncio.to_thread(self._fetch_header_page, status, None, page_size))
+        
         try:
-            workflows = []
-            
-            if status:
-                # List specific status
-                status_dir = self.storage_path / status
-                if status_dir.exists():
-                    for file_path in status_dir.glob("*.json"):
-                        workflow_data = await self._load_workflow_file(file_path)
-                        if workflow_data:
-                            workflows.append(workflow_data)
-            else:
-                # List all workflows
-                for status_dir in ["active", "completed", "failed", "archived"]:
-                    dir_path = self.storage_path / status_dir
-                    if dir_path.exists():
-                        for file_path in dir_path.glob("*.json"):
-                            workflow_data = await self._load_workflow_file(file_path)
-                            if workflow_data:
-                                workflows.append(workflow_data)
-            
-            # Sort by saved_at timestamp
-            workflows.sort(key=lambda x: x.get("saved_at", ""), reverse=True)
+            while next_page:
+                rows = await next_page
+                next_page = None
+                
+                if remaining is not None:
+                    remaining -= len(rows)
+                if len(rows) == page_size and (remaining is None or remaining > 0):
+                    page_size = LIST_PAGE_SIZE if remaining is None else min(LIST_PAGE_SIZE, remaining)
+                    last_key = (rows[-1][2], rows[-1][0])
+                    next_page = asyncio.create_task(
+                        asyncio.to_thread(self._fetch_header_page, status, last_key, page_size)
+                    )
+                
+                for workflow_id, row_status, saved_at, updated_at in rows:
+                    yield {"workflow_id": workflow_id, "status": row_status, "saved_at": saved_at, "updated_at": updated_at}
+        
+        finally:
+            # The caller stopped early; drop the page being prefetched
+            if next_page:
+                next_page.cancel()
+    
+    async def list_workflows(self, status: str = None, limit: int = None) -> List[Dict[str, Any]]:
+        """List all workflows or workflows of a specific status
+        
+        Returns workflow headers (workflow_id, status, saved_at, updated_at),
+        newest first; use load_workflow_state for the full state.
+        """
+        try:
+            workflows = [workflow async for workflow in self.iter_workflows(status, limit)]
             
             logger.info(f"Listed {len(workflows)} workflows")
             return workflows
-            
+        
         except Exception as e:
             logger.error(f"Failed to list workflows: {e}")
             return []
     
-    async def _load_workflow_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Load workflow data from a single file"""
-        try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to load workflow file {file_path}: {e}")
-            return None
-    
     async def update_workflow_status(self, workflow_id: str, new_status: str) -> bool:
-        """Update workflow status and move file to appropriate directory"""
+        """Update workflow status"""
         try:
-            # Find current workflow file
-            current_file = None
-            current_status = None
-            
-            for status_dir in ["active", "completed", "failed", "archived"]:
-                file_path = self.storage_path / status_dir / f"{workflow_id}.json"
-                if file_path.exists():
-                    current_file = file_path
-                    current_status = status_dir
-                    break
+            updated = await asyncio.to_thread(
+                self._execute,
+                "UPDATE workflows SET status = ?, updated_at = ? WHERE id = ?",
+                (new_status, datetime.now().isoformat(), workflow_id)
+            )
             
-            if not current_file:
+            if not updated:
                 logger.warning(f"Workflow not found for status update: {workflow_id}")
                 return False
             
-            # Load current state
-            with open(current_file, 'r') as f:
-                state_data = json.load(f)
-            
-            # Update status
-            state_data["status"] = new_status
-            state_data["updated_at"] = datetime.now().isoformat()
-            
-            # Determine new file path
-            if new_status == "completed":
-                new_file_path = self.storage_path / "completed" / f"{workflow_id}.json"
-            elif new_status == "failed":
-                new_file_path = self.storage_path / "failed" / f"{workflow_id}.json"
-            elif new_status == "archived":
-                new_file_path = self.storage_path / "archived" / f"{workflow_id}.json"
-            else:
-                new_file_path = self.storage_path / "active" / f"{workflow_id}.json"
-            
-            # Save to new location
-            with open(new_file_path, 'w') as f:
-                json.dump(state_data, f, indent=2, default=str)
-            
-            # Remove old file
-            if new_file_path != current_file:
-                current_file.unlink()
-            
-            logger.info(f"Updated workflow status: {workflow_id} {current_status} -> {new_status}")
+            logger.info(f"Updated workflow status: {workflow_id} -> {new_status}")
             return True
-            
+        
         except Exception as e:
             logger.error(f"Failed to update workflow status {workflow_id}: {e}")
             return False
     
+    def _archive_row(self, workflow_id: str) -> bool:
+        """Mark a workflow archived and compress its state in one transaction (blocking)"""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT state FROM workflows WHERE id = ?", (workflow_id,)).fetchone()
+            if not row:
+                return False
+            
+            state = row[0]
+            if state[:4] != _ZSTD_MAGIC:
+                state = zstandard.ZstdCompressor(level=ARCHIVE_COMPRESSION_LEVEL).compress(state)
+            conn.execute(
+                "UPDATE workflows SET status = 'archived', updated_at = ?, state = ? WHERE id = ?",
+                (datetime.now().isoformat(), state, workflow_id)
+            )
+            return True
+    
     async def archive_workflow(self, workflow_id: str) -> bool:
         """Archive a completed workflow"""
         try:
-            return await self.update_workflow_status(workflow_id, "archived")
+            if not await asyncio.to_thread(self._archive_row, workflow_id):
+                logger.warning(f"Workflow not found for archiving: {workflow_id}")
+                return False
+            
+            logger.info(f"Archived workflow: {workflow_id}")
+            return True
+        
         except Exception as e:
             logger.error(f"Failed to archive workflow {workflow_id}: {e}")
             return False
     
+    def _delete_archived_before(self, cutoff_date: str) -> int:
+        """Delete archived workflows saved before cutoff_date in short batches (blocking)
+        
+        Each batch commits on its own, so saves are not stalled behind one
+        long delete holding the write lock.
+        """
+        deleted = 0
+        with closing(self._connect()) as conn:
+            while True:
+                with conn:
+                    count = conn.execute(
+                        "DELETE FROM workflows WHERE rowid IN ("
+                        "SELECT rowid FROM workflows WHERE status = 'archived' AND saved_at < ? LIMIT ?)",
+                        (cutoff_date, CLEANUP_BATCH_SIZE)
+                    ).rowcount
+                deleted += count
+                if count < CLEANUP_BATCH_SIZE:
+                    return deleted
+    
     async def cleanup_old_workflows(self, days_to_keep: int = 30) -> int:
         """Clean up old archived workflows"""
         try:
-            cutoff_date = datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
-            cleaned_count = 0
-            
-            archived_dir = self.storage_path / "archived"
-            if archived_dir.exists():
-                for file_path in archived_dir.glob("*.json"):
-                    try:
-                        with open(file_path, 'r') as f:
-                            workflow_data = json.load(f)
-                        
-                        saved_timestamp = datetime.fromisoformat(workflow_data.get("saved_at", "1970-01-01")).timestamp()
-                        
-                        if saved_timestamp < cutoff_date:
-                            file_path.unlink()
-                            cleaned_count += 1
-                            logger.debug(f"Cleaned up old workflow: {file_path.name}")
-                    
-                    except Exception as e:
-                        logger.error(f"Failed to process workflow file {file_path}: {e}")
+            cutoff_date = datetime.fromtimestamp(
+                datetime.now().timestamp() - (days_to_keep * 24 * 60 * 60)
+            ).isoformat()
+            cleaned_count = await asyncio.to_thread(self._delete_archived_before, cutoff_date)
             
             logger.info(f"Cleaned up {cleaned_count} old workflows")
             return cleaned_count
-            
+        
         except Exception as e:
             logger.error(f"Failed to cleanup old workflows: {e}")
             return 0
@@ -215,27 +349,22 @@ class WorkflowPersistence:
     async def get_workflow_statistics(self) -> Dict[str, Any]:
         """Get statistics about stored workflows"""
         try:
-            stats = {
-                "active": 0,
-                "completed": 0,
-                "failed": 0,
-                "archived": 0,
-                "total": 0
-            }
+            stats = {status_dir: 0 for status_dir in STATUS_DIRS}
+            stats["total"] = 0
             
-            for status_dir in ["active", "completed", "failed", "archived"]:
-                dir_path = self.storage_path / status_dir
-                if dir_path.exists():
-                    count = len(list(dir_path.glob("*.json")))
-                    stats[status_dir] = count
-                    stats["total"] += count
+            rows = await asyncio.to_thread(
+                self._fetch, "SELECT status, COUNT(*) FROM workflows GROUP BY status"
+            )
+            for status, count in rows:
+                stats[status if status in stats else "active"] += count
+                stats["total"] += count
             
             # Add storage info
             stats["storage_path"] = str(self.storage_path)
             stats["generated_at"] = datetime.now().isoformat()
             
             return stats
-            
+        
         except Exception as e:
             logger.error(f"Failed to get workflow statistics: {e}")
             return {"error": str(e)}
@@ -248,29 +377,64 @@ class WorkflowPersistence:
                 return ""
             
             if export_path:
-                with open(export_path, 'w') as f:
-                    json.dump(workflow_data, f, indent=2, default=str)
+                await asyncio.to_thread(self._write_export_file, export_path, workflow_data)
                 logger.info(f"Exported workflow {workflow_id} to {export_path}")
                 return export_path
             else:
-                return json.dumps(workflow_data, indent=2, default=str)
-                
+                return orjson.dumps(workflow_data, default=str, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2).decode()
+        
         except Exception as e:
             logger.error(f"Failed to export workflow {workflow_id}: {e}")
             return ""
     
-    async def import_workflow(self, workflow_data: Dict[str, Any]) -> bool:
-        """Import a workflow from data"""
+    def _write_export_file(self, export_path: str, workflow_data: Dict[str, Any]):
+        """Write an exported workflow to disk (blocking)"""
+        with open(export_path, 'wb') as f:
+            f.write(orjson.dumps(workflow_data, default=str, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2))
+    
+    def _insert_many(self, rows: List[tuple]) -> int:
+        """Insert (id, status, saved_at, state) rows in a single transaction (blocking)"""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO workflows (id, status, saved_at, updated_at, state) "
+                "VALUES (?, ?, ?, NULL, ?)",
+                rows
+            )
+        return len(rows)
+    
+    async def import_workflows(self, items: List[Dict[str, Any]], trust: bool = True) -> int:
+        """Import a batch of workflows in one transaction
+        
+        With trust=True the items are assumed well-formed (e.g. restored
+        backups) and are written without per-item checks; otherwise items
+        without a workflow_id are skipped. A state given as bytes is stored
+        as-is instead of being re-serialized. Returns the number imported.
+        """
         try:
-            workflow_id = workflow_data.get("workflow_id")
-            if not workflow_id:
-                logger.error("No workflow_id in import data")
-                return False
+            saved_at = datetime.now().isoformat()
+            rows = []
+            for workflow_data in items:
+                if not trust and not workflow_data.get("workflow_id"):
+                    logger.error("No workflow_id in import data")
+                    continue
+                
+                state = workflow_data.get("state", {})
+                rows.append((
+                    workflow_data["workflow_id"],
+                    workflow_data.get("status", "active"),
+                    saved_at,
+                    state if isinstance(state, bytes) else self._encode_state(state)
+                ))
             
-            # Save imported workflow
-            status = workflow_data.get("status", "active")
-            return await self.save_workflow_state(workflow_id, workflow_data.get("state", {}), status)
+            imported = await asyncio.to_thread(self._insert_many, rows) if rows else 0
             
+            logger.info(f"Imported {imported} workflows")
+            return imported
+        
         except Exception as e:
-            logger.error(f"Failed to import workflow: {e}")
-            return False 
\ No newline at end of file
+            logger.error(f"Failed to import workflows: {e}")
+            return 0
+    
+    async def import_workflow(self, workflow_data: Dict[str, Any]) -> bool:
+        """Import a workflow from data"""
+        return await self.import_workflows([workflow_data], trust=False) == 1
\ No newline at end of file
@@ -1,9 +1,11 @@
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import NullPool, QueuePool
 import structlog
+import orjson
 import os
+from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 logger = structlog.get_logger()
@@ -15,6 +17,10 @@ ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg:/
 # Create base class for models
 Base = declarative_base()
 
+def _json_serializer(value) -> str:
+    """Encode JSON/JSONB columns (agent state, memory metadata) with orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
 # Database engine configuration
 engine = create_engine(
     DATABASE_URL,
@@ -23,16 +29,43 @@ engine = create_engine(
     max_overflow=30,
     pool_pre_ping=True,
     pool_recycle=3600,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     echo=False  # Set to True for SQL debugging
 )
 
+# Async pool sized to the worker's cores; extra connections only add contention
+ASYNC_POOL_SIZE = min((os.cpu_count() or 1) * 2, 10)
+
+# Short-lived processes (test scripts, one-off tools) set DB_NULL_POOL=1 to open a
+# connection per checkout and close it on return instead of keeping a pool warm
+if os.getenv("DB_NULL_POOL") == "1":
+    _async_pool_args = {"poolclass": NullPool}
+else:
+    _async_pool_args = {
+        "pool_size": ASYNC_POOL_SIZE,
+        "max_overflow": 0,
+        "pool_use_lifo": True,  # Reuse the most recently returned (warm) connection
+        "pool_pre_ping": True,
+        "pool_recycle": 3600
+    }
+
 # Async engine for async operations
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
-    pool_size=20,
-    max_overflow=30,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    **_async_pool_args,
+    pool_reset_on_return="rollback",
+    query_cache_size=1200,  # LRU-bounded compiled statement cache
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args={
+        "statement_cache_size": 1024,  # asyncpg server-side prepared statements
+        "prepared_statement_cache_size": 256,  # SQLAlchemy asyncpg adapter cache
+        "server_settings": {
+            "jit": "off",  # Short OLTP queries lose more to JIT compilation than they gain
+            "application_name": "ai_agents"
+        }
+    },
     echo=False
 )
 
@@ -56,8 +89,9 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+@asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session for use in async contexts"""
+    """Get database session for use in async contexts (async with get_db_session() as session)"""
     async with AsyncSessionLocal() as session:
         try:
             yield session
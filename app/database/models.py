@@ -2,15 +2,15 @@ from sqlalchemy import Column, String, DateTime, Float, Text, JSON, ForeignKey,
 from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP, JSONB
 from pgvector.sqlalchemy import Vector
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.database.connection import Base
-import uuid
+from uuid6 import uuid7
 
 class Agent(Base):
     """Agent model representing different AI agents in the system"""
     __tablename__ = "agents"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False, unique=True)
     agent_type = Column(String(100), nullable=False)
     status = Column(String(50), default='idle')
@@ -28,7 +28,7 @@ class AgentState(Base):
     """Agent state model for storing agent state data"""
     __tablename__ = "agent_states"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agents.id"), nullable=False)
     state_data = Column(JSONB, nullable=False)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
@@ -43,7 +43,7 @@ class ContentEmbedding(Base):
     """Content embedding model for vector similarity search"""
     __tablename__ = "content_embeddings"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     content_hash = Column(String(64), unique=True, nullable=False, index=True)
     content_text = Column(Text, nullable=False)
     embedding = Column(Vector(1536))
@@ -57,7 +57,7 @@ class AgentMemory(Base):
     """Agent memory model for storing agent memories"""
     __tablename__ = "agent_memory"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     agent_id = Column(UUID(as_uuid=True), ForeignKey("agents.id"), nullable=False)
     memory_type = Column(String(100), nullable=False)
     content = Column(Text, nullable=False)
@@ -74,7 +74,7 @@ class Workflow(Base):
     """Workflow model for storing agent workflow data"""
     __tablename__ = "workflows"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False)
     workflow_data = Column(JSONB, nullable=False)
     status = Column(String(50), default='pending')
@@ -90,3 +90,15 @@ Index('idx_agents_status', Agent.status)
 Index('idx_content_embeddings_hash', ContentEmbedding.content_hash)
 Index('idx_agent_memory_agent', AgentMemory.agent_id)
 Index('idx_agent_memory_type', AgentMemory.memory_type)
+
+# Composite and partial indexes matching the common query shapes
+Index('idx_agents_status_type', Agent.status, Agent.agent_type)
+Index('idx_agent_memory_agent_type_created', AgentMemory.agent_id, AgentMemory.memory_type, AgentMemory.created_at.desc())
+Index('idx_agent_memory_high_importance', AgentMemory.agent_id, AgentMemory.importance_score.desc(),
+      postgresql_where=text("importance_score > 0.7"))
+Index('idx_workflows_status_updated', Workflow.status, Workflow.updated_at.desc())
+
+# Approximate nearest-neighbour index for cosine similarity search
+Index('idx_content_embeddings_ann', ContentEmbedding.embedding, postgresql_using='hnsw',
+      postgresql_with={'m': 16, 'ef_construction': 64},
+      postgresql_ops={'embedding': 'vector_cosine_ops'})
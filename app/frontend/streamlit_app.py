@@ -1,18 +1,46 @@
 import streamlit as st
-import requests
-import json
+import asyncio
+import threading
+import httpx
+import orjson
+import pandas as pd
 
 API_BASE_URL = "http://localhost:8000/api/v1"
 AUTH_URL = "http://localhost:8000/auth/login"
 
+# Fields returned by the /agents and /workflows endpoints
+AGENT_COLUMNS = ("id", "name", "type", "status", "created_at")
+WORKFLOW_COLUMNS = ("id", "name", "status", "created_at", "updated_at")
+
+@st.cache_resource
+def get_client():
+    # One AsyncClient per server process, driven by its own event loop thread,
+    # so reruns from every session reuse the same keep-alive connections
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    client = httpx.AsyncClient(timeout=5.0, limits=httpx.Limits(max_connections=8, max_keepalive_connections=8))
+    return loop, client
+
+def run_on_client(coro_fn):
+    # Run coro_fn(client) on the shared loop and block the script thread for the result
+    loop, client = get_client()
+    return asyncio.run_coroutine_threadsafe(coro_fn(client), loop).result()
+
+def fetch_many(urls, headers):
+    # Issue the GETs concurrently over the shared connection pool
+    async def gather(client):
+        return await asyncio.gather(*(client.get(url, headers=headers) for url in urls))
+    return run_on_client(gather)
+
 def login():
     st.title("AI Agents System - Login")
     username = st.text_input("Username")
     password = st.text_input("Password", type="password")
     if st.button("Login"):
-        response = requests.post(AUTH_URL, json={"username": username, "password": password})
+        body = orjson.dumps({"username": username, "password": password})
+        response = run_on_client(lambda client: client.post(AUTH_URL, content=body, headers={"Content-Type": "application/json"}))
         if response.status_code == 200:
-            token = response.json().get("access_token")
+            token = orjson.loads(response.content).get("access_token")
             st.session_state["token"] = token
             st.success("Login successful!")
         else:
@@ -27,33 +55,59 @@ def logout():
         del st.session_state["token"]
     st.success("Logged out successfully.")
 
-def get_headers():
-    token = st.session_state.get("token", None)
-    if token:
-        return {"Authorization": f"Bearer {token}"}
-    return {}
+@st.cache_data(ttl=10, max_entries=100)
+def fetch_dashboard_data(token):
+    # Cached per token so reruns within the TTL skip the backend entirely;
+    # max_entries bounds the cache when many sessions are logged in.
+    # Returns (system_status, agents, workflows); an entry is None when its request failed.
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    paths = ["/system/status", "/agents", "/workflows"]
+    responses = fetch_many([f"{API_BASE_URL}{path}" for path in paths], headers)
+    # orjson parses the raw bytes directly, skipping the decode to str
+    return tuple(orjson.loads(resp.content) if resp.status_code == 200 else None for resp in responses)
+
+def to_frame(rows, columns, category_columns=()):
+    # Known columns skip pandas' schema inference; typed columns let
+    # st.dataframe use its native renderers instead of formatting object
+    # columns cell by cell
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    for column in ("created_at", "updated_at"):
+        if column in df:
+            df[column] = pd.to_datetime(df[column])
+    for column in category_columns:
+        if column in df:
+            df[column] = df[column].astype("category")
+    return df
 
 def show_dashboard():
     st.title("AI Agents Dashboard")
     st.write("Welcome to the AI Agents System dashboard.")
     
-    # Fetch agents
-    agents_resp = requests.get(f"{API_BASE_URL}/agents", headers=get_headers())
-    if agents_resp.status_code == 200:
-        agents = agents_resp.json()
+    if st.button("Refresh"):
+        fetch_dashboard_data.clear()
+    
+    # Fetch system status, agents and workflows
+    system_status, agents, workflows = fetch_dashboard_data(st.session_state.get("token"))
+    
+    if system_status is not None:
+        st.caption(f"System: {system_status['status']} (v{system_status['version']})")
+    
+    # Show agents
+    if agents is not None:
         st.subheader("Agents")
-        for agent in agents:
-            st.write(f"- {agent['name']} ({agent['type']}) - Status: {agent['status']}")
+        st.dataframe(to_frame(agents, AGENT_COLUMNS, ("type", "status")), use_container_width=True)
     else:
         st.error("Failed to fetch agents. Please login again.")
     
-    # Fetch workflows
-    workflows_resp = requests.get(f"{API_BASE_URL}/workflows", headers=get_headers())
-    if workflows_resp.status_code == 200:
-        workflows = workflows_resp.json()
+    # Show workflows
+    if workflows is not None:
         st.subheader("Workflows")
-        for wf in workflows:
-            st.write(f"- {wf['name']} - Status: {wf['status']}")
+        st.dataframe(to_frame(workflows, WORKFLOW_COLUMNS, ("status",)), use_container_width=True)
+        if workflows:
+            # Render details for one selected row instead of one element per workflow
+            selected = st.selectbox("Inspect workflow", range(len(workflows)), format_func=lambda i: workflows[i]["name"])
+            with st.expander("Workflow details", expanded=True):
+                st.json(workflows[selected])
     else:
         st.error("Failed to fetch workflows. Please login again.")
     
@@ -1,38 +1,41 @@
 from fastapi import FastAPI, HTTPException, Response, Request, Depends, status, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import structlog
 import os
+import time
 from contextlib import asynccontextmanager
 
 from app.core.security import authenticate_user, create_access_token
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, multiprocess
 import langsmith
 from app.database.connection import init_db
 from app.api.routes import router as api_router
 # Removed import of create_streamlit_app as it does not exist
 # from app.frontend.streamlit_app import create_streamlit_app
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
-    cache_logger_on_first_use=True,
-)
+def configure_logging():
+    """Configure structured logging (called once at startup)"""
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.processors.JSONRenderer()
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
 
 logger = structlog.get_logger()
 
@@ -40,6 +43,7 @@ logger = structlog.get_logger()
 async def lifespan(app: FastAPI):
     """Application lifespan management"""
     # Startup
+    configure_logging()
     logger.info("Starting AI Agents application")
     try:
         # Initialize LangSmith tracing
@@ -64,7 +68,8 @@ app = FastAPI(
     title="AI Agents System",
     description="Production-ready multi-agent AI system for content generation",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add global exception handler for high-end error handling
@@ -75,7 +80,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     and return a structured JSON response.
     """
     logger.error("Unhandled exception", exc_info=exc, request_url=str(request.url))
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
@@ -84,15 +89,20 @@ async def global_exception_handler(request: Request, exc: Exception):
         },
     )
 
-# Add CORS middleware
+# Add CORS middleware; explicit origins let browsers cache preflights for a day
+ALLOWED_ORIGINS = [origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "http://localhost:8501").split(",") if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
 
+# Compress larger responses (agent and workflow listings)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
 
@@ -141,11 +151,26 @@ async def health_check():
         "database": "connected"  # You can add actual DB health check here
     }
 
+# With several workers, PROMETHEUS_MULTIPROC_DIR makes every worker report the combined metrics
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    METRICS_REGISTRY = CollectorRegistry()
+    multiprocess.MultiProcessCollector(METRICS_REGISTRY)
+else:
+    METRICS_REGISTRY = REGISTRY
+
+# Rendered exposition text, reused by scrapes within METRICS_CACHE_TTL seconds
+METRICS_CACHE_TTL = 1.0
+_metrics_cache = {"expires_at": 0.0, "body": b""}
+
 # Prometheus metrics endpoint
 @app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint"""
-    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    now = time.monotonic()
+    if now >= _metrics_cache["expires_at"]:
+        _metrics_cache["body"] = generate_latest(METRICS_REGISTRY)
+        _metrics_cache["expires_at"] = now + METRICS_CACHE_TTL
+    return Response(_metrics_cache["body"], media_type=CONTENT_TYPE_LATEST)
 
 # Root endpoint
 @app.get("/")
@@ -164,4 +189,12 @@ async def root():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Workers need the import string; uvloop and httptools come with uvicorn[standard]
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools"
+    )
@@ -1,15 +1,18 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load environment variables from .env, once per process"""
+    load_dotenv()
 
 class Config:
     """Configuration settings for AI Publisher"""
     
-    # API Keys
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-    SEARCH1API_KEY = os.getenv("SEARCH1API_KEY")
+    # API Keys (read from the environment when Config is instantiated)
+    OPENAI_API_KEY = None
+    SEARCH1API_KEY = None
     
     # Model Settings
     OPENAI_MODEL = "gpt-4o-mini"  # Cheapest GPT-4 model
@@ -35,6 +38,9 @@ class Config:
     GPT4_MINI_OUTPUT_COST = 0.000600  # per 1K tokens
     
     def __init__(self):
+        _load_env()
+        self.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+        self.SEARCH1API_KEY = os.getenv("SEARCH1API_KEY")
         self._validate_config()
     
     def _validate_config(self):
@@ -48,4 +54,9 @@ class Config:
         """Estimate cost for GPT-4 mini usage"""
         input_cost = (input_tokens / 1000) * self.GPT4_MINI_INPUT_COST
         output_cost = (output_tokens / 1000) * self.GPT4_MINI_OUTPUT_COST
-        return input_cost + output_cost
\ No newline at end of file
+        return input_cost + output_cost
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared, already validated Config instance"""
+    return Config()
\ No newline at end of file
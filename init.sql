@@ -52,8 +52,26 @@ CREATE INDEX IF NOT EXISTS idx_content_embeddings_hash ON content_embeddings(con
 CREATE INDEX IF NOT EXISTS idx_agent_memory_agent ON agent_memory(agent_id);
 CREATE INDEX IF NOT EXISTS idx_agent_memory_type ON agent_memory(memory_type);
 
+-- Composite and partial indexes matching the common query shapes
+CREATE INDEX IF NOT EXISTS idx_agents_status_type ON agents(status, agent_type);
+CREATE INDEX IF NOT EXISTS idx_agent_memory_agent_type_created ON agent_memory(agent_id, memory_type, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_agent_memory_high_importance ON agent_memory(agent_id, importance_score DESC) WHERE importance_score > 0.7;
+CREATE INDEX IF NOT EXISTS idx_workflows_status_updated ON workflows(status, updated_at DESC);
+
+-- Convert embeddings stored as text by older deployments to the native vector type
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'content_embeddings' AND column_name = 'embedding' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE content_embeddings ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector;
+    END IF;
+END $$;
+
 -- Create vector similarity search index
-CREATE INDEX IF NOT EXISTS idx_content_embeddings_vector ON content_embeddings USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+DROP INDEX IF EXISTS idx_content_embeddings_vector;
+CREATE INDEX IF NOT EXISTS idx_content_embeddings_ann ON content_embeddings USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 
 -- Insert default agents
 INSERT INTO agents (name, agent_type) VALUES 
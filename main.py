@@ -7,8 +7,10 @@ Cost: ~$0.016 per article using GPT-4-mini
 
 import os
 import json
+import string
+import sys
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 from agents.input_normalizer import InputNormalizer
@@ -16,11 +18,21 @@ from agents.keyword_extractor import KeywordExtractor
 from agents.content_retriever import ContentRetriever
 from agents.duplication_checker import DuplicationChecker
 from agents.article_writer import ArticleWriter
-from config.settings import Config
+from config.settings import get_config
+
+# Interactive command that generates several ';'-separated topics as one batch
+BATCH_PREFIX = "batch:"
+
+# Phrases counted as citations by the quality check
+CITATION_INDICATORS = ['according to', 'research shows', 'study found', 'data indicates']
+
+# Deletes every ASCII character not allowed in output filenames
+_TITLE_ALLOWED = set(string.ascii_letters + string.digits + ' -_')
+_TITLE_FILTER = str.maketrans('', '', ''.join(chr(i) for i in range(128) if chr(i) not in _TITLE_ALLOWED))
 
 class AIPublisher:
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.cost_tracker = {"total_cost": 0.0, "articles_generated": 0}
         
         # Initialize agents
@@ -33,35 +45,54 @@ class AIPublisher:
         # Ensure output directory exists
         os.makedirs("output", exist_ok=True)
         
-    def generate_article(self, input_phrase: str) -> Dict:
-        """Main pipeline to generate article from input phrase"""
+    def generate_articles(self, input_phrases: List[str]) -> List[Dict]:
+        """Generate several articles, extracting their keywords in batched LLM calls"""
+        normalized = [self.normalizer.normalize(phrase) for phrase in input_phrases]
+        keyword_results = self.keyword_extractor.extract_batch(normalized)
+        return [
+            self.generate_article(phrase, keywords_result, normalized_input)
+            for phrase, keywords_result, normalized_input in zip(input_phrases, keyword_results, normalized)
+        ]
+    
+    def generate_article(self, input_phrase: str, keywords_result: Optional[Dict] = None,
+                         normalized: Optional[Dict] = None) -> Dict:
+        """Main pipeline to generate article from input phrase
+        
+        keywords_result and normalized skip keyword extraction and normalization
+        when they were already done in a batch.
+        """
         print(f"\n🚀 Starting AI Article Generation for: '{input_phrase}'")
         print("=" * 60)
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         pipeline_cost = 0.0
         
         try:
             # Agent 1: Normalize Input
             print("📝 Step 1: Normalizing input...")
-            normalized = self.normalizer.normalize(input_phrase)
+            if normalized is None:
+                normalized = self.normalizer.normalize(input_phrase)
             print(f"✅ Input normalized: {normalized['cleaned']}")
             
             # Agent 2: Extract Keywords
             print("\n🔍 Step 2: Extracting keywords...")
-            keywords_result = self.keyword_extractor.extract(normalized)
+            if keywords_result is None:
+                keywords_result = self.keyword_extractor.extract(normalized)
             keywords = keywords_result['keywords']
             pipeline_cost += keywords_result['cost']
             print(f"✅ Keywords extracted: {keywords}")
             
-            # Agent 3: Research Content
+            # Agents 3 and 4 overlap: the keyword-only title candidates are
+            # checked for duplicates while research is being gathered
             print("\n📚 Step 3: Researching content...")
-            research = self.content_retriever.retrieve(keywords)
-            print(f"✅ Research gathered: {len(research['sources'])} sources")
-            
-            # Agent 4: Check Duplication
             print("\n🔍 Step 4: Checking for duplicates...")
-            title_result = self.duplication_checker.generate_unique_title(keywords, research)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                base_title = pool.submit(self.duplication_checker.find_unique_base_title, keywords)
+                research = self.content_retriever.retrieve(keywords)
+                print(f"✅ Research gathered: {len(research['sources'])} sources")
+                
+                # Trending-topic titles need the research, so they are only tried if no base title is unique
+                title_result = base_title.result() or self.duplication_checker.find_unique_research_title(keywords, research)
             title = title_result['title']
             is_unique = title_result['is_unique']
             print(f"✅ Title generated: '{title}' (Unique: {is_unique})")
@@ -76,7 +107,7 @@ class AIPublisher:
             
             # Quality Check
             print("\n📊 Step 6: Quality assessment...")
-            quality_score = self._calculate_quality_score(article, keywords)
+            quality_score = self._calculate_quality_score(article, keywords, word_count)
             print(f"✅ Quality score: {quality_score}/100")
             
             # Save Article
@@ -85,7 +116,7 @@ class AIPublisher:
                 'sources': len(research['sources']),
                 'cost': pipeline_cost,
                 'quality_score': quality_score,
-                'processing_time': time.time() - start_time
+                'processing_time': (time.perf_counter_ns() - start_ns) / 1e9
             })
             
             # Update cost tracking
@@ -94,7 +125,8 @@ class AIPublisher:
             
             print(f"\n🎉 Article saved: {filename}")
             print(f"💰 Cost: ${pipeline_cost:.4f}")
-            print(f"⏱️  Processing time: {time.time() - start_time:.2f} seconds")
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+            print(f"⏱️  Processing time: {processing_time:.2f} seconds")
             
             return {
                 'success': True,
@@ -103,7 +135,7 @@ class AIPublisher:
                 'word_count': word_count,
                 'cost': pipeline_cost,
                 'quality_score': quality_score,
-                'processing_time': time.time() - start_time
+                'processing_time': processing_time
             }
             
         except Exception as e:
@@ -114,12 +146,14 @@ class AIPublisher:
                 'cost': pipeline_cost
             }
     
-    def _calculate_quality_score(self, article: str, keywords: List[str]) -> int:
+    def _calculate_quality_score(self, article: str, keywords: List[str],
+                                 word_count: Optional[int] = None) -> int:
         """Calculate article quality score (0-100)"""
         score = 0
         
-        # Word count check (30 points)
-        word_count = len(article.split())
+        # Word count check (30 points); reuse the caller's count when given
+        if word_count is None:
+            word_count = len(article.split())
         if word_count >= 1500:
             score += 30
         elif word_count >= 1000:
@@ -141,8 +175,7 @@ class AIPublisher:
             score += 10
         
         # Citation check (20 points)
-        citation_indicators = ['according to', 'research shows', 'study found', 'data indicates']
-        citations = sum(1 for indicator in citation_indicators if indicator in article_lower)
+        citations = sum(1 for indicator in CITATION_INDICATORS if indicator in article_lower)
         score += min(20, citations * 5)
         
         return min(100, score)
@@ -150,16 +183,21 @@ class AIPublisher:
     def _save_article(self, article: str, title: str, metadata: Dict) -> str:
         """Save article to file with metadata"""
         # Create filename
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
+        if title.isascii():
+            safe_title = title.translate(_TITLE_FILTER).rstrip()
+        else:
+            # Non-ASCII letters are kept too, so fall back to the per-character check
+            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
         safe_title = safe_title.replace(' ', '_').lower()[:50]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = time.localtime()
+        timestamp = time.strftime("%Y%m%d_%H%M%S", now)
         filename = f"output/{safe_title}_{timestamp}.md"
         
         # Prepare content
         content = f"""# {title}
 
 *Generated by AI Publishing Pipeline*  
-*Date: {datetime.now().strftime("%B %d, %Y")}*  
+*Date: {time.strftime("%B %d, %Y", now)}*  
 *Keywords: {', '.join(metadata['keywords'])}*  
 *Quality Score: {metadata['quality_score']}/100*  
 *Processing Time: {metadata['processing_time']:.2f}s*  
@@ -174,14 +212,14 @@ class AIPublisher:
 *This article was generated using AI technology and should be reviewed before publication.*
 """
         
-        # Save file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Save file as pre-encoded bytes in a single write
+        with open(filename, 'wb') as f:
+            f.write(content.encode('utf-8'))
         
         # Save metadata
         metadata_file = filename.replace('.md', '_metadata.json')
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        with open(metadata_file, 'wb') as f:
+            f.write(json.dumps(metadata, indent=2).encode('utf-8'))
         
         return filename
     
@@ -195,6 +233,14 @@ class AIPublisher:
             avg_cost = self.cost_tracker['total_cost'] / self.cost_tracker['articles_generated']
             print(f"Average cost per article: ${avg_cost:.4f}")
 
+def report_results(results: List[Dict]):
+    """Print where each generated article was saved, or why it failed"""
+    for result in results:
+        if result['success']:
+            print(f"\n✨ Success! Check '{result['filename']}' for your article.")
+        else:
+            print(f"\n❌ Failed to generate article: {result.get('error', 'Unknown error')}")
+
 def main():
     """Main CLI interface"""
     print("🤖 AI Publishing Pipeline MVP")
@@ -204,10 +250,17 @@ def main():
     
     publisher = AIPublisher()
     
+    # Piped input: read every phrase up front (one per line) and generate them as one batch
+    if not sys.stdin.isatty():
+        phrases = [line.strip() for line in sys.stdin if line.strip()]
+        report_results(publisher.generate_articles(phrases))
+        publisher.show_stats()
+        return
+    
     while True:
         try:
             # Get user input
-            print("\nEnter a phrase or topic (or 'quit' to exit, 'stats' for statistics):")
+            print("\nEnter a phrase or topic, or 'batch: topic one; topic two' for several (or 'quit' to exit, 'stats' for statistics):")
             user_input = input("> ").strip()
             
             if user_input.lower() == 'quit':
@@ -221,14 +274,17 @@ def main():
                 print("⚠️  Please enter a topic or phrase.")
                 continue
             
-            # Generate article
-            result = publisher.generate_article(user_input)
-            
-            if result['success']:
-                print(f"\n✨ Success! Check '{result['filename']}' for your article.")
+            # Generate articles; only an explicit batch command splits the input into several topics,
+            # which then share batched keyword extraction
+            if user_input.lower().startswith(BATCH_PREFIX):
+                phrases = [phrase.strip() for phrase in user_input[len(BATCH_PREFIX):].split(';') if phrase.strip()]
+                if not phrases:
+                    print("⚠️  Please enter at least one topic after 'batch:'.")
+                    continue
             else:
-                print(f"\n❌ Failed to generate article: {result.get('error', 'Unknown error')}")
-                
+                phrases = [user_input]
+            report_results(publisher.generate_articles(phrases))
+            
         except KeyboardInterrupt:
             publisher.show_stats()
             print("\n👋 Goodbye!")
@@ -0,0 +1,52 @@
+"""
+Shared helpers for the testing scripts
+Import as testing_scripts._support, with the project root on sys.path
+"""
+
+import asyncio
+import itertools
+import os
+import sys
+import uuid
+
+# HEMIST_TEST_QUIET=1 drops the summary banner, leaving only the result lines
+QUIET = os.getenv("HEMIST_TEST_QUIET") == "1"
+
+# Agent ids count up from one random base per run: still valid UUIDs for the
+# memory tables, without an entropy read for every agent
+_AGENT_ID_BASE = uuid.uuid4().int >> 32 << 32
+_agent_counter = itertools.count()
+
+def install_uvloop():
+    """Run asyncio.run entry points on uvloop when it is installed"""
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+def next_agent_id() -> str:
+    """Return the next agent id, unique within this run"""
+    return str(uuid.UUID(int=_AGENT_ID_BASE | next(_agent_counter)))
+
+def import_skipped(error) -> bool:
+    """Report a skip when the script's module-level app imports failed"""
+    if error:
+        print(f"❌ Skipped, app modules failed to import: {error}")
+        return True
+    return False
+
+def write_report(title: str, lines: list, width: int = 60):
+    """Write the summary as one UTF-8 buffer, bypassing per-line text encoding"""
+    if not QUIET:
+        bar = "=" * width
+        lines = ["\n" + bar, title, bar, *lines]
+    report = ("\n".join(lines) + "\n").encode("utf-8")
+    # Flush pending text first so the report lands after it
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(report.decode("utf-8"))
+    else:
+        buffer.write(report)
+        buffer.flush()
@@ -15,25 +15,67 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Add the project root to Python path
-project_root = Path(__file__).parent
+project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
+from testing_scripts._support import install_uvloop
+
+install_uvloop()
+
+from app.agents.coordinator import CoordinatorAgent
+from app.agents.researcher import ResearchAgent
+from app.agents.writer import WriterAgent
+from app.agents.editor import EditorAgent
+from app.agents.memory import MemoryAgent
+from app.core import WorkflowPersistence
+
+# Characters of a generated article echoed to the console
+PREVIEW_LENGTH = 500
+
+# Slice size for writing articles, so the encoder never holds a full encoded copy
+WRITE_CHUNK_SIZE = 64 * 1024
+
+HELP_TEXT = """Available commands:
+  generate <topic> - Generate content on a topic
+  test - Test individual agents
+  status - Show system status
+  help - Show this help
+  quit - Exit the system"""
+
+def _print_lines(lines: list):
+    """Print a block of lines with a single write instead of one print per line"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _preview(text: str, limit: int = PREVIEW_LENGTH) -> str:
+    """Return text cut to limit characters, marked with ... when cut"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def _write_output(output_file: str, header: str, content: str):
+    """Write a generated article to disk (blocking)"""
+    with open(output_file, 'w') as f:
+        f.write(header)
+        f.writelines(content[i:i + WRITE_CHUNK_SIZE] for i in range(0, len(content), WRITE_CHUNK_SIZE))
+
 async def run_content_generation_workflow(topic: str, target_length: int = 1200, 
                                         writing_style: str = "professional", 
-                                        target_quality: float = 0.85):
-    """Run a complete content generation workflow"""
+                                        target_quality: float = 0.85, coordinator=None):
+    """Run a complete content generation workflow
+    
+    Pass a coordinator to reuse its already initialized sub-agents across runs.
+    """
     try:
-        from app.agents.coordinator import CoordinatorAgent
-        
-        print(f"🚀 Starting content generation workflow...")
-        print(f"📝 Topic: {topic}")
-        print(f"📏 Target Length: {target_length} words")
-        print(f"✍️  Writing Style: {writing_style}")
-        print(f"🎯 Target Quality: {target_quality}")
-        print("-" * 50)
+        _print_lines([
+            "🚀 Starting content generation workflow...",
+            f"📝 Topic: {topic}",
+            f"📏 Target Length: {target_length} words",
+            f"✍️  Writing Style: {writing_style}",
+            f"🎯 Target Quality: {target_quality}",
+            "-" * 50
+        ])
         
         # Create coordinator agent
-        coordinator = CoordinatorAgent("coordinator_cli", "CLI Coordinator")
+        if coordinator is None:
+            coordinator = CoordinatorAgent("coordinator_cli", "CLI Coordinator")
         
         # Prepare workflow context
         context = {
@@ -48,39 +90,37 @@ async def run_content_generation_workflow(topic: str, target_length: int = 1200,
         result = await coordinator.execute(context)
         
         if result.get("status") == "success":
-            print("\n✅ Workflow completed successfully!")
-            print("=" * 50)
-            
-            # Show results
+            # Show results: research, writing and editing phases, then the final content
             workflow_summary = result.get("workflow_summary", {})
-            
-            # Research phase
             research = workflow_summary.get("research_phase", {})
-            print(f"📚 Research Phase: {research.get('insights_count', 0)} insights, {research.get('sources_count', 0)} sources")
-            
-            # Writing phase
             writing = workflow_summary.get("writing_phase", {})
-            print(f"✍️  Writing Phase: {writing.get('word_count', 0)} words, Quality: {writing.get('writing_quality', 0):.2f}")
-            
-            # Editing phase
             editing = workflow_summary.get("editing_phase", {})
-            print(f"🔍 Editing Phase: Final Quality: {editing.get('final_quality', 0):.2f}")
+            lines = [
+                "\n✅ Workflow completed successfully!",
+                "=" * 50,
+                f"📚 Research Phase: {research.get('insights_count', 0)} insights, {research.get('sources_count', 0)} sources",
+                f"✍️  Writing Phase: {writing.get('word_count', 0)} words, Quality: {writing.get('writing_quality', 0):.2f}",
+                f"🔍 Editing Phase: Final Quality: {editing.get('final_quality', 0):.2f}"
+            ]
             
-            # Final content
             final_content = result.get("final_content", "")
             if final_content:
-                print(f"\n📄 Final Content ({len(final_content)} characters):")
-                print("-" * 30)
-                print(final_content[:500] + "..." if len(final_content) > 500 else final_content)
+                lines += [
+                    f"\n📄 Final Content ({len(final_content)} characters):",
+                    "-" * 30,
+                    _preview(final_content)
+                ]
+            _print_lines(lines)
             
-            # Save to file
+            # Save to file off the event loop, so concurrent workflows keep running
             output_file = f"output_{topic.replace(' ', '_').lower()}.md"
-            with open(output_file, 'w') as f:
-                f.write(f"# {topic}\n\n")
-                f.write(f"**Generated:** {result.get('workflow_metadata', {}).get('completed_at', 'Unknown')}\n")
-                f.write(f"**Quality Score:** {result.get('final_quality', 0):.2f}\n")
-                f.write(f"**Word Count:** {writing.get('word_count', 0)}\n\n")
-                f.write(final_content)
+            header = (
+                f"# {topic}\n\n"
+                f"**Generated:** {result.get('workflow_metadata', {}).get('completed_at', 'Unknown')}\n"
+                f"**Quality Score:** {result.get('final_quality', 0):.2f}\n"
+                f"**Word Count:** {writing.get('word_count', 0)}\n\n"
+            )
+            await asyncio.to_thread(_write_output, output_file, header, final_content)
             
             print(f"\n💾 Content saved to: {output_file}")
             
@@ -96,56 +136,67 @@ async def run_content_generation_workflow(topic: str, target_length: int = 1200,
         traceback.print_exc()
         return False
 
+async def run_batch_content_generation(topics: list, target_length: int = 1200,
+                                       writing_style: str = "professional",
+                                       target_quality: float = 0.85):
+    """Run content generation workflows for several topics concurrently"""
+    print(f"🚀 Starting {len(topics)} content generation workflows concurrently...")
+    
+    # Each workflow gets its own coordinator, so the runs share no state
+    results = await asyncio.gather(*(
+        run_content_generation_workflow(topic, target_length, writing_style, target_quality)
+        for topic in topics
+    ))
+    
+    succeeded = sum(1 for result in results if result)
+    print(f"\n📦 Batch finished: {succeeded}/{len(topics)} workflows succeeded")
+    return succeeded == len(topics)
+
 async def test_individual_agents():
     """Test individual agents"""
     try:
         print("🧪 Testing Individual Agents...")
         print("=" * 40)
         
-        # Test Research Agent
-        print("\n🔍 Testing Research Agent...")
-        from app.agents.researcher import ResearchAgent
-        researcher = ResearchAgent("test_researcher", "Test Researcher")
-        research_result = await researcher.execute({
-            "topic": "AI in Healthcare",
-            "depth": "basic",
-            "max_sources": 3
-        })
-        print(f"   Research: {'✅' if research_result.get('status') == 'success' else '❌'}")
+        # The agents are independent, so run them concurrently. Each agent is built
+        # inside its own coroutine, so a failing constructor only fails its own check
+        async def run(factory, context):
+            return await factory().execute(context)
         
-        # Test Writer Agent
-        print("\n✍️  Testing Writer Agent...")
-        from app.agents.writer import WriterAgent
-        writer = WriterAgent("test_writer", "Test Writer")
-        writing_result = await writer.execute({
-            "topic": "AI in Healthcare",
-            "target_length": 500,
-            "writing_style": "professional"
-        })
-        print(f"   Writing: {'✅' if writing_result.get('status') == 'success' else '❌'}")
+        tests = [
+            ("Research", lambda: ResearchAgent("test_researcher", "Test Researcher"), {
+                "topic": "AI in Healthcare",
+                "depth": "basic",
+                "max_sources": 3
+            }),
+            ("Writing", lambda: WriterAgent("test_writer", "Test Writer"), {
+                "topic": "AI in Healthcare",
+                "target_length": 500,
+                "writing_style": "professional"
+            }),
+            ("Editing", lambda: EditorAgent("test_editor", "Test Editor"), {
+                "content": "AI is transforming healthcare through machine learning and automation.",
+                "topic": "AI in Healthcare",
+                "target_quality": 0.8
+            }),
+            ("Memory", lambda: MemoryAgent("test_memory", "Test Memory"), {
+                "operation": "store",
+                "content": "Test memory content",
+                "memory_type": "test",
+                "importance": 0.7
+            })
+        ]
+        print("\n🔄 Running Research, Writer, Editor and Memory agents...")
+        results = await asyncio.gather(
+            *(run(factory, context) for _, factory, context in tests),
+            return_exceptions=True
+        )
         
-        # Test Editor Agent
-        print("\n🔍 Testing Editor Agent...")
-        from app.agents.editor import EditorAgent
-        editor = EditorAgent("test_editor", "Test Editor")
-        editing_result = await editor.execute({
-            "content": "AI is transforming healthcare through machine learning and automation.",
-            "topic": "AI in Healthcare",
-            "target_quality": 0.8
-        })
-        print(f"   Editing: {'✅' if editing_result.get('status') == 'success' else '❌'}")
-        
-        # Test Memory Agent
-        print("\n🧠 Testing Memory Agent...")
-        from app.agents.memory import MemoryAgent
-        memory_agent = MemoryAgent("test_memory", "Test Memory")
-        memory_result = await memory_agent.execute({
-            "operation": "store",
-            "content": "Test memory content",
-            "memory_type": "test",
-            "importance": 0.7
-        })
-        print(f"   Memory: {'✅' if memory_result.get('status') == 'success' else '❌'}")
+        for (label, _, _), result in zip(tests, results):
+            if isinstance(result, Exception):
+                print(f"   {label}: ❌ ({result})")
+            else:
+                print(f"   {label}: {'✅' if result.get('status') == 'success' else '❌'}")
         
         print("\n✅ All agent tests completed!")
         return True
@@ -159,30 +210,33 @@ async def test_individual_agents():
 async def show_system_status():
     """Show system status and statistics"""
     try:
-        print("📊 AI Agents System Status")
-        print("=" * 30)
-        
-        # Check workflow persistence
-        from app.core import WorkflowPersistence
+        # Check workflow persistence: statistics and the last 5 workflows are independent queries
         persistence = WorkflowPersistence()
-        stats = await persistence.get_workflow_statistics()
+        stats, recent_workflows = await asyncio.gather(
+            persistence.get_workflow_statistics(),
+            persistence.list_workflows(limit=5)
+        )
         
-        print(f"📁 Storage Path: {stats.get('storage_path', 'Unknown')}")
-        print(f"🔄 Active Workflows: {stats.get('active', 0)}")
-        print(f"✅ Completed Workflows: {stats.get('completed', 0)}")
-        print(f"❌ Failed Workflows: {stats.get('failed', 0)}")
-        print(f"📦 Archived Workflows: {stats.get('archived', 0)}")
-        print(f"📈 Total Workflows: {stats.get('total', 0)}")
+        lines = [
+            "📊 AI Agents System Status",
+            "=" * 30,
+            f"📁 Storage Path: {stats.get('storage_path', 'Unknown')}",
+            f"🔄 Active Workflows: {stats.get('active', 0)}",
+            f"✅ Completed Workflows: {stats.get('completed', 0)}",
+            f"❌ Failed Workflows: {stats.get('failed', 0)}",
+            f"📦 Archived Workflows: {stats.get('archived', 0)}",
+            f"📈 Total Workflows: {stats.get('total', 0)}"
+        ]
         
-        # Check recent workflows
-        recent_workflows = await persistence.list_workflows()
+        # Show recent workflows
         if recent_workflows:
-            print(f"\n🕒 Recent Workflows:")
-            for workflow in recent_workflows[:5]:  # Show last 5
-                workflow_id = workflow.get("workflow_id", "Unknown")
-                status = workflow.get("status", "Unknown")
-                saved_at = workflow.get("saved_at", "Unknown")
-                print(f"   {workflow_id[:8]}... - {status} - {saved_at[:19]}")
+            lines.append("\n🕒 Recent Workflows:")
+            lines += [
+                f"   {workflow.get('workflow_id', 'Unknown')[:8]}... - "
+                f"{workflow.get('status', 'Unknown')} - {workflow.get('saved_at', 'Unknown')[:19]}"
+                for workflow in recent_workflows
+            ]
+        _print_lines(lines)
         
         return True
         
@@ -192,35 +246,26 @@ async def show_system_status():
 
 async def interactive_mode():
     """Run in interactive mode"""
-    print("🎮 AI Agents System - Interactive Mode")
-    print("=" * 40)
-    print("Available commands:")
-    print("  generate <topic> - Generate content on a topic")
-    print("  test - Test individual agents")
-    print("  status - Show system status")
-    print("  help - Show this help")
-    print("  quit - Exit the system")
-    print("-" * 40)
+    _print_lines(["🎮 AI Agents System - Interactive Mode", "=" * 40, HELP_TEXT, "-" * 40])
+    
+    # Check if running in an interactive terminal before starting any agents
+    if not sys.stdin.isatty():
+        print("Non-interactive mode detected. Exiting.")
+        return
+    
+    # One coordinator for the whole session, so its sub-agents stay warm between generations
+    coordinator = CoordinatorAgent("coordinator_cli", "CLI Coordinator")
+    await coordinator.initialize()
     
     while True:
         try:
-            # Check if running in an interactive terminal
-            if not sys.stdin.isatty():
-                print("Non-interactive mode detected. Exiting.")
-                break
-            
             command = input("\n🤖 Enter command: ").strip().lower()
             
             if command == "quit" or command == "exit":
                 print("👋 Goodbye!")
                 break
             elif command == "help":
-                print("Available commands:")
-                print("  generate <topic> - Generate content on a topic")
-                print("  test - Test individual agents")
-                print("  status - Show system status")
-                print("  help - Show this help")
-                print("  quit - Exit the system")
+                print(HELP_TEXT)
             elif command == "test":
                 await test_individual_agents()
             elif command == "status":
@@ -228,7 +273,7 @@ async def interactive_mode():
             elif command.startswith("generate "):
                 topic = command[9:].strip()
                 if topic:
-                    await run_content_generation_workflow(topic)
+                    await run_content_generation_workflow(topic, coordinator=coordinator)
                 else:
                     print("❌ Please provide a topic: generate <topic>")
             else:
@@ -239,11 +284,14 @@ async def interactive_mode():
             break
         except Exception as e:
             print(f"❌ Error: {e}")
+    
+    await coordinator.cleanup()
 
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="AI Agents System CLI")
     parser.add_argument("--topic", "-t", help="Topic for content generation")
+    parser.add_argument("--topics-file", "-f", help="File with one topic per line, generated concurrently")
     parser.add_argument("--length", "-l", type=int, default=1200, help="Target word count")
     parser.add_argument("--style", "-s", default="professional", help="Writing style")
     parser.add_argument("--quality", "-q", type=float, default=0.85, help="Target quality (0.0-1.0)")
@@ -257,6 +305,12 @@ def main():
     
     if args.interactive:
         asyncio.run(interactive_mode())
+    elif args.topics_file:
+        with open(args.topics_file) as f:
+            topics = [line.strip() for line in f if line.strip()]
+        asyncio.run(run_batch_content_generation(
+            topics, args.length, args.style, args.quality
+        ))
     elif args.topic:
         asyncio.run(run_content_generation_workflow(
             args.topic, args.length, args.style, args.quality
@@ -4,11 +4,13 @@ Test script to verify agent memory integration
 """
 
 import asyncio
-import uuid
-from typing import Dict, Any
+from typing import Dict, Any, List
 from app.core.base_agent import BaseAgent, AgentType
 from app.database.connection import init_db
 from app.database.models import Agent
+from testing_scripts._support import install_uvloop, next_agent_id
+
+install_uvloop()
 
 class TestAgent(BaseAgent):
     """A simple test agent for memory integration testing"""
@@ -18,13 +20,25 @@ class TestAgent(BaseAgent):
     
     async def _execute_impl(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Simple test implementation"""
-        await self.store_memory(
-            content=f"Test execution with context: {context}",
-            memory_type="test_execution",
-            importance_score=0.8,
-            metadata={"test": True, "context": context}
-        )
-        return {"status": "success", "message": "Test execution completed"}
+        results = await self._execute_impl_batch([context])
+        return results[0]
+    
+    async def _execute_impl_batch(self, contexts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Store one memory per context with a single batched call"""
+        await self.store_memory_batch([
+            {
+                "content": f"Test execution with context: {context}",
+                "memory_type": "test_execution",
+                "importance_score": 0.8,
+                "metadata": {"test": True, "context": context}
+            }
+            for context in contexts
+        ])
+        return [{"status": "success", "message": "Test execution completed"} for _ in contexts]
+    
+    async def execute_batch(self, contexts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Execute several contexts at once, paying for one embedding request and one commit"""
+        return await self._execute_impl_batch(contexts)
 
 async def test_agent_memory_integration():
     """Test the complete agent memory integration"""
@@ -34,33 +48,36 @@ async def test_agent_memory_integration():
     await init_db()
     
     # Create test agent
-    agent_id = str(uuid.uuid4())
+    agent_id = next_agent_id()
     agent = TestAgent(agent_id)
     
     # Test 1: Store memories
     print("\n--- Test 1: Storing Memories ---")
-    memory1 = await agent.store_memory(
-        content="This is a test memory about AI research",
-        memory_type="research",
-        importance_score=0.9,
-        metadata={"topic": "AI", "source": "test"}
-    )
-    print(f"Stored memory 1: {memory1}")
-    
-    memory2 = await agent.store_memory(
-        content="Another test memory about machine learning",
-        memory_type="research",
-        importance_score=0.8,
-        metadata={"topic": "ML", "source": "test"}
-    )
-    print(f"Stored memory 2: {memory2}")
+    memory_ids = await agent.store_memory_batch([
+        {
+            "content": "This is a test memory about AI research",
+            "memory_type": "research",
+            "importance_score": 0.9,
+            "metadata": {"topic": "AI", "source": "test"}
+        },
+        {
+            "content": "Another test memory about machine learning",
+            "memory_type": "research",
+            "importance_score": 0.8,
+            "metadata": {"topic": "ML", "source": "test"}
+        }
+    ])
+    for i, memory_id in enumerate(memory_ids, 1):
+        print(f"Stored memory {i}: {memory_id}")
     
     # Test 2: Retrieve memories
     print("\n--- Test 2: Retrieving Memories ---")
-    memories = await agent.retrieve_memories(memory_type="research")
-    print(f"Retrieved {len(memories)} research memories:")
-    for mem in memories:
+    # Later pages are fetched while earlier ones are printed
+    count = 0
+    async for mem in agent.iter_memories(memory_type="research"):
         print(f"  - {mem.content} (importance: {mem.importance_score})")
+        count += 1
+    print(f"Retrieved {count} research memories")
     
     # Test 3: Similarity search
     print("\n--- Test 3: Similarity Search ---")
@@ -74,6 +91,11 @@ async def test_agent_memory_integration():
     result = await agent.execute({"task": "test memory integration"})
     print(f"Execution result: {result}")
     
+    batch_results = await agent.execute_batch([
+        {"task": "test batched execution", "index": i} for i in range(3)
+    ])
+    print(f"Batch execution results: {batch_results}")
+    
     # Test 5: Retrieve execution memories
     print("\n--- Test 5: Retrieving Execution Memories ---")
     exec_memories = await agent.retrieve_memories(memory_type="test_execution")
@@ -10,17 +10,21 @@ import sys
 from pathlib import Path
 
 # Add the project root to Python path
-project_root = Path(__file__).parent
+project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
+from testing_scripts._support import install_uvloop
+
+install_uvloop()
+
+from app.agents.coordinator import CoordinatorAgent
+from app.core import AgentType
+
 async def test_coordinator_agent_initialization():
     """Test Coordinator Agent initialization"""
     print("🧪 Testing Coordinator Agent Initialization...")
     
     try:
-        from app.agents.coordinator import CoordinatorAgent
-        from app.core import AgentType
-        
         # Create coordinator agent
         coordinator = CoordinatorAgent("coordinator_001", "Test Coordinator")
         print("✅ Coordinator Agent created successfully")
@@ -48,8 +52,6 @@ async def test_coordinator_agent_workflow():
     print("\n🧪 Testing Complete Workflow Orchestration...")
     
     try:
-        from app.agents.coordinator import CoordinatorAgent
-        
         # Create coordinator agent
         coordinator = CoordinatorAgent("coordinator_002", "Workflow Coordinator")
         
@@ -130,8 +132,6 @@ async def test_coordinator_agent_controls():
     print("\n🧪 Testing Workflow Controls...")
     
     try:
-        from app.agents.coordinator import CoordinatorAgent
-        
         # Create coordinator agent
         coordinator = CoordinatorAgent("coordinator_003", "Control Tester")
         
@@ -169,8 +169,6 @@ async def test_coordinator_agent_memory():
     print("\n🧪 Testing Memory and History...")
     
     try:
-        from app.agents.coordinator import CoordinatorAgent
-        
         # Create coordinator agent
         coordinator = CoordinatorAgent("coordinator_004", "Memory Tester")
         
@@ -205,8 +203,6 @@ async def test_coordinator_agent_cleanup():
     print("\n🧪 Testing Cleanup...")
     
     try:
-        from app.agents.coordinator import CoordinatorAgent
-        
         # Create coordinator agent
         coordinator = CoordinatorAgent("coordinator_005", "Cleanup Tester")
         
@@ -222,34 +218,50 @@ async def test_coordinator_agent_cleanup():
         traceback.print_exc()
         return False
 
+async def _require_pass(test):
+    """Await a test coroutine and raise if it did not pass, so the task group cancels its peers"""
+    if await test is not True:
+        raise RuntimeError(f"{test.__name__} failed")
+
 async def main():
     """Run all tests"""
     print("🚀 Starting Coordinator Agent Tests\n")
     
-    # Test 1: Initialization
-    init_success = await test_coordinator_agent_initialization()
-    
-    # Test 2: Complete Workflow
-    workflow_success = await test_coordinator_agent_workflow()
-    
-    # Test 3: Workflow Controls
-    controls_success = await test_coordinator_agent_controls()
-    
-    # Test 4: Memory and History
-    memory_success = await test_coordinator_agent_memory()
+    # Each test builds its own coordinator, so they run concurrently:
+    # initialization, complete workflow, workflow controls, memory and history, cleanup.
+    # The first failure cancels the rest instead of letting each one run into its own timeout.
+    tasks = []
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(_require_pass(test()))
+                for test in (
+                    test_coordinator_agent_initialization,
+                    test_coordinator_agent_workflow,
+                    test_coordinator_agent_controls,
+                    test_coordinator_agent_memory,
+                    test_coordinator_agent_cleanup
+                )
+            ]
+    except* Exception as group:
+        print(f"\n⚠️  {group.exceptions[0]}; remaining tests were cancelled")
     
-    # Test 5: Cleanup
-    cleanup_success = await test_coordinator_agent_cleanup()
+    # A test that failed, raised or was cancelled counts as failed
+    init_success, workflow_success, controls_success, memory_success, cleanup_success = [
+        not task.cancelled() and task.exception() is None for task in tasks
+    ]
     
-    # Summary
-    print("\n" + "="*50)
-    print("📊 TEST RESULTS SUMMARY")
-    print("="*50)
-    print(f"Initialization: {'✅ PASSED' if init_success else '❌ FAILED'}")
-    print(f"Complete Workflow: {'✅ PASSED' if workflow_success else '❌ FAILED'}")
-    print(f"Workflow Controls: {'✅ PASSED' if controls_success else '❌ FAILED'}")
-    print(f"Memory & History: {'✅ PASSED' if memory_success else '❌ FAILED'}")
-    print(f"Cleanup: {'✅ PASSED' if cleanup_success else '❌ FAILED'}")
+    # Summary, written in one go
+    sys.stdout.write("\n".join([
+        "\n" + "="*50,
+        "📊 TEST RESULTS SUMMARY",
+        "="*50,
+        f"Initialization: {'✅ PASSED' if init_success else '❌ FAILED'}",
+        f"Complete Workflow: {'✅ PASSED' if workflow_success else '❌ FAILED'}",
+        f"Workflow Controls: {'✅ PASSED' if controls_success else '❌ FAILED'}",
+        f"Memory & History: {'✅ PASSED' if memory_success else '❌ FAILED'}",
+        f"Cleanup: {'✅ PASSED' if cleanup_success else '❌ FAILED'}"
+    ]) + "\n")
     
     if all([init_success, workflow_success, controls_success, memory_success, cleanup_success]):
         print("\n🎉 ALL TESTS PASSED! Coordinator Agent is working correctly.")
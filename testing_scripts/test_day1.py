@@ -5,11 +5,18 @@ Tests the basic infrastructure setup
 """
 
 import asyncio
+import importlib.util
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-# Add the app directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from testing_scripts._support import install_uvloop
+
+install_uvloop()
 
 async def test_database_connection():
     """Test database connection setup"""
@@ -64,6 +71,10 @@ def test_main_app():
         print(f"❌ Main app test failed: {e}")
         return False
 
+def _is_available(dep):
+    """Check whether a package can be found, without executing it"""
+    return importlib.util.find_spec(dep) is not None
+
 def test_dependencies():
     """Test that all required dependencies are available"""
     dependencies = [
@@ -77,13 +88,16 @@ def test_dependencies():
         'structlog'
     ]
     
+    # Locate the packages in parallel, overlapping the filesystem lookups
+    with ThreadPoolExecutor(max_workers=len(dependencies)) as pool:
+        available = list(pool.map(_is_available, dependencies))
+    
     missing = []
-    for dep in dependencies:
-        try:
-            __import__(dep)
-            print(f"✅ {dep} imported successfully")
-        except ImportError:
-            print(f"❌ {dep} import failed")
+    for dep, found in zip(dependencies, available):
+        if found:
+            print(f"✅ {dep} is available")
+        else:
+            print(f"❌ {dep} not found")
             missing.append(dep)
     
     if missing:
@@ -106,18 +120,21 @@ async def main():
         ("Main Application", test_main_app)
     ]
     
+    # The tests are independent: run them together, sync ones in worker threads
+    print(f"\n🧪 Testing {', '.join(test_name for test_name, _ in tests)}...")
+    outcomes = await asyncio.gather(
+        *(test_func() if asyncio.iscoroutinefunction(test_func) else asyncio.to_thread(test_func)
+          for _, test_func in tests),
+        return_exceptions=True
+    )
+    
     results = []
-    for test_name, test_func in tests:
-        print(f"\n🧪 Testing {test_name}...")
-        try:
-            if asyncio.iscoroutinefunction(test_func):
-                result = await test_func()
-            else:
-                result = test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {test_name} test crashed: {outcome}")
             results.append((test_name, False))
+        else:
+            results.append((test_name, outcome))
     
     print("\n" + "=" * 50)
     print("📊 Test Results Summary")
@@ -6,20 +6,39 @@ Tests all core components: state machine, base agent, memory manager, communicat
 
 import asyncio
 import sys
-import os
-import uuid
+import time
 from datetime import datetime
+from pathlib import Path
 
-# Add app directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+# Add the project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from testing_scripts._support import import_skipped, install_uvloop, next_agent_id, write_report
+
+install_uvloop()
+
+# Import once at module level; a failed import makes each test report a skip instead of crashing
+try:
+    from app.core import (
+        WorkflowStateMachine, BaseAgent, AgentType, MemoryManager,
+        AgentCommunicationHub, AgentMessage, MessageType, MessagePriority,
+        WorkflowOrchestrator
+    )
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
+
+_BAR = "=" * 60
 
 async def test_state_machine():
     """Test the LangGraph state machine"""
     print("🧪 Testing State Machine...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.core import WorkflowStateMachine, WorkflowContext, WorkflowState
-        
         # Create state machine
         sm = WorkflowStateMachine()
         print("✅ State machine created successfully")
@@ -43,16 +62,17 @@ async def test_base_agent():
     """Test the base agent class"""
     print("\n🧪 Testing Base Agent...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.core import BaseAgent, AgentStatus, AgentType
-        
         # Create a test agent (we'll need to implement the abstract method)
         class TestAgent(BaseAgent):
             async def execute(self, context):
                 return {"result": "test completed", "agent": self.name}
         
         # Create agent
-        agent = TestAgent(str(uuid.uuid4()), AgentType.RESEARCHER, "Test Researcher")
+        agent = TestAgent(next_agent_id(), AgentType.RESEARCHER, "Test Researcher")
         print("✅ Test agent created successfully")
         
         # Test initialization
@@ -73,11 +93,11 @@ async def test_base_agent():
         memory_id = await agent.store_memory("Test memory content", "test", 0.8)
         print(f"✅ Memory stored: {memory_id}")
         
-        memories = await agent.retrieve_memories("test")
-        print(f"✅ Memories retrieved: {len(memories)}")
-        
-        # Test status
+        # Retrieval depends only on the store above; read the status while it is in flight
+        memories_task = asyncio.create_task(agent.retrieve_memories("test"))
         status = agent.get_status()
+        memories = await memories_task
+        print(f"✅ Memories retrieved: {len(memories)}")
         print(f"✅ Agent status: {status['status']}")
         
         return True
@@ -90,9 +110,10 @@ async def test_memory_manager():
     """Test the memory manager"""
     print("\n🧪 Testing Memory Manager...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.core import MemoryManager
-        
         # Create memory manager
         mm = MemoryManager()
         print("✅ Memory manager created successfully")
@@ -128,9 +149,10 @@ async def test_communication_hub():
     """Test the communication hub"""
     print("\n🧪 Testing Communication Hub...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.core import AgentCommunicationHub, AgentMessage, MessageType, MessagePriority
-        
         # Create communication hub
         hub = AgentCommunicationHub()
         print("✅ Communication hub created successfully")
@@ -155,6 +177,24 @@ async def test_communication_hub():
         messages = await hub.get_messages("test_agent_1")
         print(f"✅ Messages retrieved: {len(messages)}")
         
+        # Test batch throughput: queue 1000 messages, then drain them
+        batch = [
+            AgentMessage(
+                sender_id="test_agent_1",
+                recipient_id="test_agent_1",
+                message_type=MessageType.STATUS_UPDATE,
+                content={"sequence": i}
+            )
+            for i in range(1000)
+        ]
+        start = time.perf_counter()
+        sent_count = await hub.send_many(batch)
+        drained = await hub.get_messages("test_agent_1")
+        elapsed = time.perf_counter() - start
+        if sent_count != len(batch) or len(drained) != len(batch):
+            raise AssertionError(f"sent {sent_count} and drained {len(drained)} of {len(batch)} messages")
+        print(f"✅ Batch round trip: {len(drained)} messages in {elapsed * 1000:.1f} ms")
+        
         # Test hub status
         status = hub.get_hub_status()
         print(f"✅ Hub status: {status['registered_agents']} agents")
@@ -169,9 +209,10 @@ async def test_workflow_orchestrator():
     """Test the workflow orchestrator"""
     print("\n🧪 Testing Workflow Orchestrator...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.core import WorkflowOrchestrator, BaseAgent, AgentType
-        
         # Create orchestrator
         orchestrator = WorkflowOrchestrator()
         print("✅ Workflow orchestrator created successfully")
@@ -184,8 +225,8 @@ async def test_workflow_orchestrator():
         execution_id = await orchestrator.execute_workflow("Test Topic", 500, 0.7)
         print(f"✅ Workflow execution started: {execution_id}")
         
-        # Wait a bit for workflow to process
-        await asyncio.sleep(2)
+        # Wait up to 2 seconds for the workflow, waking as soon as its run ends
+        await orchestrator.wait_for_completion(execution_id, timeout=2.0)
         
         # Test workflow status
         status = await orchestrator.get_workflow_status(execution_id)
@@ -208,7 +249,7 @@ async def test_workflow_orchestrator():
 async def main():
     """Run all Day 2 foundation tests"""
     print("🚀 Day 2: Agent Framework & State Management Tests")
-    print("=" * 60)
+    print(_BAR)
     
     tests = [
         ("State Machine", test_state_machine),
@@ -218,30 +259,25 @@ async def main():
         ("Workflow Orchestrator", test_workflow_orchestrator)
     ]
     
+    # The tests are independent and mostly waiting on I/O, so run them concurrently;
+    # gather keeps the outcomes in test order for the summary
+    outcomes = await asyncio.gather(*(test_func() for _, test_func in tests), return_exceptions=True)
+    
     results = []
-    for test_name, test_func in tests:
-        try:
-            success = await test_func()
-            results.append((test_name, success))
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"❌ {test_name} test crashed: {outcome}")
             results.append((test_name, False))
+        else:
+            results.append((test_name, outcome))
     
-    # Print summary
-    print("\n" + "=" * 60)
-    print("📊 Day 2 Foundation Test Results")
-    print("=" * 60)
-    
-    passed = 0
+    # Print summary in one write
+    passed = sum(1 for _, success in results if success)
     total = len(results)
-    
-    for test_name, success in results:
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}")
-        if success:
-            passed += 1
-    
-    print(f"\n🎯 Results: {passed}/{total} tests passed")
+    write_report("📊 Day 2 Foundation Test Results", [
+        *(f"{'✅ PASS' if success else '❌ FAIL'} {test_name}" for test_name, success in results),
+        f"\n🎯 Results: {passed}/{total} tests passed"
+    ])
     
     if passed == total:
         print("🎉 All Day 2 foundation tests passed! Ready for Day 3.")
@@ -7,24 +7,32 @@ Tests the Editor Agent and Editing Tools functionality
 import asyncio
 import os
 import sys
+import traceback
 from pathlib import Path
 
 # Add the project root to Python path
-project_root = Path(__file__).parent
+project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
-async def test_editing_tools():
-    """Test EditingTools functionality"""
-    print("🧪 Testing EditingTools...")
-    
-    try:
-        from app.agents.editor.tools import EditingTools
-        
-        tools = EditingTools()
-        print("✅ EditingTools initialized successfully")
-        
-        # Test content quality analysis
-        content = """
+from testing_scripts._support import import_skipped, install_uvloop, write_report
+
+install_uvloop()
+
+# Import once at module level; a failed import makes each test report a skip instead of crashing
+try:
+    from app.agents.editor import EditorAgent
+    from app.agents.editor.tools import EditingTools
+    from app.core import AgentType
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
+
+# Print full stack traces for failing tests only when asked to
+_VERBOSE = os.getenv("HEMIST_TEST_VERBOSE") == "1"
+
+# Shared test inputs, built once at import; the tests only read them
+
+_AI_HEALTHCARE_ARTICLE = """
         Artificial Intelligence in Healthcare
         
         AI is transforming healthcare in many ways. Machine learning algorithms can analyze medical images 
@@ -36,27 +44,104 @@ async def test_editing_tools():
         
         The future looks promising. AI will continue to advance and become more integrated into healthcare.
         """
+
+_AI_HEALTHCARE_RESEARCH = {
+    "insights": [
+        "AI improves diagnostic accuracy by 20%",
+        "Machine learning reduces treatment costs",
+        "Privacy concerns exist in healthcare AI"
+    ],
+    "sources": [
+        {"url": "example.com", "title": "AI Healthcare Study"}
+    ]
+}
+
+_AI_HEALTHCARE_OUTLINE = """
+        # AI in Healthcare
+        
+        ## Introduction
+        Artificial Intelligence is revolutionizing healthcare.
+        
+        ## Main Content
+        AI helps with diagnosis and treatment planning.
+        
+        ## Conclusion
+        The future of healthcare is AI-powered.
+        """
+
+_AI_STUDY_RESEARCH = {
+    "insights": ["AI improves diagnosis", "Machine learning helps treatment"],
+    "sources": [{"url": "example.com", "title": "AI Study"}]
+}
+
+_RENEWABLE_ENERGY_ARTICLE = """
+            # The Future of Renewable Energy
+            
+            Solar power is the best energy source. It provides 100% of our energy needs and costs nothing.
+            Wind energy is also good but not as good as solar. Nuclear power is dangerous and should be banned.
+            
+            The future is bright for renewable energy. Everyone should switch to solar panels immediately.
+            """
+
+_RENEWABLE_ENERGY_RESEARCH = {
+    "insights": [
+        "Solar power costs have decreased significantly",
+        "Wind energy is becoming competitive",
+        "Nuclear power has safety considerations",
+        "Renewable energy adoption is increasing"
+    ],
+    "sources": [
+        {"url": "energy.gov", "title": "Renewable Energy Report 2024"},
+        {"url": "iea.org", "title": "Global Energy Outlook"}
+    ]
+}
+
+_AI_HEALTHCARE_SECTIONS = """
+        # AI in Healthcare
+        
+        ## Introduction
+        Artificial Intelligence is transforming healthcare delivery and improving patient outcomes.
+        
+        ## Main Benefits
+        AI helps doctors diagnose diseases faster and more accurately than traditional methods.
+        
+        ## Challenges
+        Privacy concerns and regulatory compliance issues exist.
+        
+        ## Conclusion
+        The future of healthcare is increasingly AI-powered.
+        """
+
+_SECTION_REVIEW_RESEARCH = {
+    "insights": ["AI improves diagnosis", "Privacy concerns exist"],
+    "sources": [{"url": "example.com", "title": "AI Study"}]
+}
+
+async def test_editing_tools():
+    """Test EditingTools functionality"""
+    print("🧪 Testing EditingTools...")
+    
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
+    try:
+        tools = EditingTools()
+        print("✅ EditingTools initialized successfully")
         
+        content = _AI_HEALTHCARE_ARTICLE
         topic = "Artificial Intelligence in Healthcare"
-        quality_metrics = await tools.analyze_content_quality(content, topic)
+        research_data = _AI_HEALTHCARE_RESEARCH
+        
+        # Test content quality analysis and fact-checking; neither uses the other's result
+        async with asyncio.TaskGroup() as tg:
+            quality_task = tg.create_task(tools.analyze_content_quality(content, topic))
+            fact_check_task = tg.create_task(tools.fact_check_content(content, research_data))
+        quality_metrics, fact_check_result = quality_task.result(), fact_check_task.result()
+        
         print(f"✅ Content quality analysis completed")
         print(f"   Readability score: {quality_metrics.get('readability_score', 0):.2f}")
         print(f"   Topic relevance: {quality_metrics.get('topic_relevance', 0):.2f}")
         print(f"   Structure quality: {quality_metrics.get('structure_quality', 0):.2f}")
-        
-        # Test fact-checking
-        research_data = {
-            "insights": [
-                "AI improves diagnostic accuracy by 20%",
-                "Machine learning reduces treatment costs",
-                "Privacy concerns exist in healthcare AI"
-            ],
-            "sources": [
-                {"url": "example.com", "title": "AI Healthcare Study"}
-            ]
-        }
-        
-        fact_check_result = await tools.fact_check_content(content, research_data)
         print(f"✅ Fact-check completed: {fact_check_result.get('accuracy_score', 0):.2f} accuracy")
         
         # Test content improvement
@@ -67,19 +152,19 @@ async def test_editing_tools():
         
     except Exception as e:
         print(f"❌ EditingTools test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if _VERBOSE:
+            traceback.print_exc()
         return False
 
 async def test_editor_agent():
     """Test EditorAgent functionality"""
     print("\n🧪 Testing EditorAgent...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.editor import EditorAgent
-        from app.core import AgentType
-        
-        # Create editor agent
+        # Create editor agent; the tests run concurrently and execute() updates agent state
         agent = EditorAgent("editor_001", "Test Editor")
         print("✅ EditorAgent created successfully")
         
@@ -90,29 +175,16 @@ async def test_editor_agent():
         print(f"   OpenAI Client: {'Available' if agent.openai_client else 'Not available (fallback mode)'}")
         
         # Test content analysis
-        content = """
-        # AI in Healthcare
-        
-        ## Introduction
-        Artificial Intelligence is revolutionizing healthcare.
-        
-        ## Main Content
-        AI helps with diagnosis and treatment planning.
+        content = _AI_HEALTHCARE_OUTLINE
         
-        ## Conclusion
-        The future of healthcare is AI-powered.
-        """
+        research_data = _AI_STUDY_RESEARCH
         
-        research_data = {
-            "insights": ["AI improves diagnosis", "Machine learning helps treatment"],
-            "sources": [{"url": "example.com", "title": "AI Study"}]
-        }
-        
-        analysis_result = await agent._analyze_content_quality("AI in Healthcare", content, research_data)
+        # Quality analysis and fact-checking are independent; only editing needs both
+        async with asyncio.TaskGroup() as tg:
+            analysis_task = tg.create_task(agent._analyze_content_quality("AI in Healthcare", content, research_data))
+            fact_check_task = tg.create_task(agent._fact_check_content(content, research_data))
+        analysis_result, fact_check_result = analysis_task.result(), fact_check_task.result()
         print(f"✅ Content quality analysis: {analysis_result.get('overall_quality', 0):.2f}")
-        
-        # Test fact-checking
-        fact_check_result = await agent._fact_check_content(content, research_data)
         print(f"✅ Fact-check completed: {fact_check_result.get('accuracy_score', 0):.2f}")
         
         # Test content editing
@@ -127,43 +199,26 @@ async def test_editor_agent():
         
     except Exception as e:
         print(f"❌ EditorAgent test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if _VERBOSE:
+            traceback.print_exc()
         return False
 
 async def test_editor_agent_execution():
     """Test full EditorAgent execution workflow"""
     print("\n🧪 Testing EditorAgent execution workflow...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.editor import EditorAgent
-        
         # Create editor agent
-        agent = EditorAgent("editor_002", "Workflow Editor")
+        agent = EditorAgent("editor_002", "Execution Tester")
         
         # Test context
         context = {
-            "content": """
-            # The Future of Renewable Energy
-            
-            Solar power is the best energy source. It provides 100% of our energy needs and costs nothing.
-            Wind energy is also good but not as good as solar. Nuclear power is dangerous and should be banned.
-            
-            The future is bright for renewable energy. Everyone should switch to solar panels immediately.
-            """,
+            "content": _RENEWABLE_ENERGY_ARTICLE,
             "topic": "The Future of Renewable Energy",
-            "research_data": {
-                "insights": [
-                    "Solar power costs have decreased significantly",
-                    "Wind energy is becoming competitive",
-                    "Nuclear power has safety considerations",
-                    "Renewable energy adoption is increasing"
-                ],
-                "sources": [
-                    {"url": "energy.gov", "title": "Renewable Energy Report 2024"},
-                    {"url": "iea.org", "title": "Global Energy Outlook"}
-                ]
-            },
+            "research_data": _RENEWABLE_ENERGY_RESEARCH,
             "target_quality": 0.9,
             "editing_style": "comprehensive"
         }
@@ -195,41 +250,25 @@ async def test_editor_agent_execution():
         
     except Exception as e:
         print(f"❌ EditorAgent execution test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if _VERBOSE:
+            traceback.print_exc()
         return False
 
 async def test_section_review():
     """Test specific section review functionality"""
     print("\n🧪 Testing Section Review...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.editor import EditorAgent
-        
         # Create editor agent
         agent = EditorAgent("editor_003", "Section Reviewer")
         
         # Test content with sections
-        content = """
-        # AI in Healthcare
-        
-        ## Introduction
-        Artificial Intelligence is transforming healthcare delivery and improving patient outcomes.
-        
-        ## Main Benefits
-        AI helps doctors diagnose diseases faster and more accurately than traditional methods.
-        
-        ## Challenges
-        Privacy concerns and regulatory compliance issues exist.
+        content = _AI_HEALTHCARE_SECTIONS
         
-        ## Conclusion
-        The future of healthcare is increasingly AI-powered.
-        """
-        
-        research_data = {
-            "insights": ["AI improves diagnosis", "Privacy concerns exist"],
-            "sources": [{"url": "example.com", "title": "AI Study"}]
-        }
+        research_data = _SECTION_REVIEW_RESEARCH
         
         # Review specific section
         section_review = await agent.review_specific_section(content, "Main Benefits", research_data)
@@ -247,34 +286,40 @@ async def test_section_review():
         
     except Exception as e:
         print(f"❌ Section review test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        if _VERBOSE:
+            traceback.print_exc()
         return False
 
 async def main():
     """Run all tests"""
     print("🚀 Starting Editor Agent Tests\n")
     
-    # Test 1: Editing Tools
-    tools_success = await test_editing_tools()
-    
-    # Test 2: Editor Agent Basic
-    agent_success = await test_editor_agent()
+    # Load the scorers' dictionaries and patterns once, so the first test's timing excludes it
+    if not IMPORT_ERROR:
+        EditingTools().warmup()
     
-    # Test 3: Editor Agent Execution
-    execution_success = await test_editor_agent_execution()
+    # The tests are independent, so run them concurrently:
+    # editing tools, editor agent basic, editor agent execution, section review
+    results = await asyncio.gather(
+        test_editing_tools(),
+        test_editor_agent(),
+        test_editor_agent_execution(),
+        test_section_review(),
+        return_exceptions=True
+    )
     
-    # Test 4: Section Review
-    section_review_success = await test_section_review()
+    # A test that raised counts as failed
+    tools_success, agent_success, execution_success, section_review_success = [
+        result is True for result in results
+    ]
     
-    # Summary
-    print("\n" + "="*50)
-    print("📊 TEST RESULTS SUMMARY")
-    print("="*50)
-    print(f"Editing Tools: {'✅ PASSED' if tools_success else '❌ FAILED'}")
-    print(f"Editor Agent: {'✅ PASSED' if agent_success else '❌ FAILED'}")
-    print(f"Execution Workflow: {'✅ PASSED' if execution_success else '❌ FAILED'}")
-    print(f"Section Review: {'✅ PASSED' if section_review_success else '❌ FAILED'}")
+    # Summary, printed in one write
+    write_report("📊 TEST RESULTS SUMMARY", [
+        f"Editing Tools: {'✅ PASSED' if tools_success else '❌ FAILED'}",
+        f"Editor Agent: {'✅ PASSED' if agent_success else '❌ FAILED'}",
+        f"Execution Workflow: {'✅ PASSED' if execution_success else '❌ FAILED'}",
+        f"Section Review: {'✅ PASSED' if section_review_success else '❌ FAILED'}"
+    ], width=50)
     
     if all([tools_success, agent_success, execution_success, section_review_success]):
         print("\n🎉 ALL TESTS PASSED! Editor Agent is working correctly.")
@@ -7,20 +7,33 @@ Tests the Memory Agent functionality for advanced context management
 import asyncio
 import os
 import sys
+import traceback
 from pathlib import Path
 
 # Add the project root to Python path
-project_root = Path(__file__).parent
+project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
+from testing_scripts._support import import_skipped, install_uvloop
+
+install_uvloop()
+
+# Import once at module level; a failed import makes each test report a skip instead of crashing
+try:
+    from app.agents.memory import MemoryAgent
+    from app.core import AgentType
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
+
 async def test_memory_agent_initialization():
     """Test Memory Agent initialization"""
     print("🧪 Testing Memory Agent Initialization...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.memory import MemoryAgent
-        from app.core import AgentType
-        
         # Create memory agent
         agent = MemoryAgent("memory_001", "Test Memory Agent")
         print("✅ Memory Agent created successfully")
@@ -40,7 +53,6 @@ async def test_memory_agent_initialization():
         
     except Exception as e:
         print(f"❌ Memory Agent initialization test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -48,9 +60,10 @@ async def test_memory_operations():
     """Test basic memory operations"""
     print("\n🧪 Testing Basic Memory Operations...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.memory import MemoryAgent
-        
         # Create memory agent
         agent = MemoryAgent("memory_002", "Memory Operations Tester")
         
@@ -87,11 +100,13 @@ async def test_memory_operations():
         organize_result = await agent.execute(organize_context)
         print(f"✅ Memory organization: {organize_result.get('status')}")
         
+        # Let the background operation records finish before the loop closes
+        await agent.cleanup()
+        
         return True
         
     except Exception as e:
         print(f"❌ Memory operations test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -99,9 +114,10 @@ async def test_memory_analysis():
     """Test memory analysis operations"""
     print("\n🧪 Testing Memory Analysis...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.memory import MemoryAgent
-        
         # Create memory agent
         agent = MemoryAgent("memory_003", "Memory Analysis Tester")
         
@@ -127,23 +143,20 @@ async def test_memory_analysis():
             }
         ]
         
-        # Store test memories
-        for memory_data in test_memories:
-            store_context = {
-                "operation": "store",
-                **memory_data
-            }
-            await agent.execute(store_context)
+        # Store test memories in one batch
+        store_results = await agent.batch_execute([
+            {"operation": "store", **memory_data} for memory_data in test_memories
+        ])
         
-        print("✅ Test memories stored successfully")
+        print(f"✅ Test memories stored: {sum(r.get('status') == 'success' for r in store_results)}/{len(test_memories)}")
         
-        # Test memory overview
-        overview_context = {
-            "operation": "analyze",
-            "analysis_type": "overview"
-        }
+        # The overview, trends and quality analyses only read the stored memories, so run them together
+        overview_result, trends_result, quality_result = await asyncio.gather(*(
+            agent.execute({"operation": "analyze", "analysis_type": analysis_type})
+            for analysis_type in ("overview", "trends", "quality")
+        ))
         
-        overview_result = await agent.execute(overview_context)
+        # Test memory overview
         print(f"✅ Memory overview: {overview_result.get('status')}")
         
         if overview_result.get("status") == "success":
@@ -152,28 +165,15 @@ async def test_memory_analysis():
             print(f"   Memory Health: {overview_result.get('memory_health', 'unknown')}")
         
         # Test memory trends
-        trends_context = {
-            "operation": "analyze",
-            "analysis_type": "trends"
-        }
-        
-        trends_result = await agent.execute(trends_context)
         print(f"✅ Memory trends: {trends_result.get('status')}")
         
         # Test memory quality analysis
-        quality_context = {
-            "operation": "analyze",
-            "analysis_type": "quality"
-        }
-        
-        quality_result = await agent.execute(quality_context)
         print(f"✅ Memory quality: {quality_result.get('status')}")
         
         return True
         
     except Exception as e:
         print(f"❌ Memory analysis test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -181,25 +181,29 @@ async def test_memory_cleanup():
     """Test memory cleanup operations"""
     print("\n🧪 Testing Memory Cleanup...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.memory import MemoryAgent
-        
         # Create memory agent
         agent = MemoryAgent("memory_004", "Memory Cleanup Tester")
         
         # Test cleanup operations
         cleanup_types = ["expired", "low_importance", "duplicates"]
         
-        for cleanup_type in cleanup_types:
-            cleanup_context = {
-                "operation": "cleanup",
-                "cleanup_type": cleanup_type,
-                "threshold": 30
-            }
-            
-            cleanup_result = await agent.execute(cleanup_context)
+        # Start all three cleanups together
+        start_results = await asyncio.gather(*(
+            agent.execute({"operation": "cleanup", "cleanup_type": cleanup_type, "threshold": 30})
+            for cleanup_type in cleanup_types
+        ))
+        for cleanup_type, cleanup_result in zip(cleanup_types, start_results):
             print(f"✅ {cleanup_type.title()} cleanup: {cleanup_result.get('status')}")
-            
+        
+        # Cleanups run in the background; wait for them and report their results
+        await agent.cleanup()
+        
+        for cleanup_type in cleanup_types:
+            cleanup_result = agent.cleanup_results.get(cleanup_type, {})
             if cleanup_result.get("status") == "success":
                 if cleanup_type == "expired":
                     print(f"   Expired memories: {cleanup_result.get('expired_memories', 0)}")
@@ -212,7 +216,6 @@ async def test_memory_cleanup():
         
     except Exception as e:
         print(f"❌ Memory cleanup test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -220,9 +223,10 @@ async def test_memory_indexing():
     """Test memory indexing functionality"""
     print("\n🧪 Testing Memory Indexing...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.memory import MemoryAgent
-        
         # Create memory agent
         agent = MemoryAgent("memory_005", "Memory Indexing Tester")
         
@@ -250,7 +254,6 @@ async def test_memory_indexing():
         
     except Exception as e:
         print(f"❌ Memory indexing test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -258,9 +261,10 @@ async def test_advanced_memory_features():
     """Test advanced memory features"""
     print("\n🧪 Testing Advanced Memory Features...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.memory import MemoryAgent
-        
         # Create memory agent
         agent = MemoryAgent("memory_006", "Advanced Features Tester")
         
@@ -299,7 +303,6 @@ async def test_advanced_memory_features():
         
     except Exception as e:
         print(f"❌ Advanced memory features test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -6,21 +6,34 @@ Tests research capabilities, content extraction, and insight generation
 
 import asyncio
 import sys
+import traceback
 import os
-import uuid
 
-# Add app directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'app'))
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from testing_scripts._support import import_skipped, install_uvloop, next_agent_id
+
+install_uvloop()
+
+# Import once at module level; a failed import makes each test report a skip instead of crashing
+try:
+    from app.agents import ResearchAgent
+    from app.agents.researcher.tools import ResearchTools
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
 
 async def test_research_agent():
     """Test the Research Agent functionality"""
     print("🧪 Testing Research Agent...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents import ResearchAgent
-        
         # Create research agent
-        agent_id = str(uuid.uuid4())
+        agent_id = next_agent_id()
         agent = ResearchAgent(agent_id, "Test Research Agent")
         print("✅ Research agent created successfully")
         
@@ -56,7 +69,6 @@ async def test_research_agent():
         
     except Exception as e:
         print(f"❌ Research agent test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -64,9 +76,10 @@ async def test_research_tools():
     """Test the Research Tools functionality"""
     print("\n🧪 Testing Research Tools...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.researcher.tools import ResearchTools
-        
         # Create research tools
         tools = ResearchTools()
         print("✅ Research tools created successfully")
@@ -96,7 +109,6 @@ async def test_research_tools():
         
     except Exception as e:
         print(f"❌ Research tools test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -7,19 +7,34 @@ Tests the Writer Agent and Writing Tools functionality
 import asyncio
 import os
 import sys
+import traceback
 from pathlib import Path
 
 # Add the project root to Python path
-project_root = Path(__file__).parent
+project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
+from testing_scripts._support import import_skipped, install_uvloop
+
+install_uvloop()
+
+# Import once at module level; a failed import makes each test report a skip instead of crashing
+try:
+    from app.agents.writer.tools import WritingTools
+    from app.agents.writer import WriterAgent
+    from app.core import AgentType
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
+
 async def test_writing_tools():
     """Test WritingTools functionality"""
     print("🧪 Testing WritingTools...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.writer.tools import WritingTools
-        
         tools = WritingTools()
         print("✅ WritingTools initialized successfully")
         
@@ -57,7 +72,6 @@ async def test_writing_tools():
         
     except Exception as e:
         print(f"❌ WritingTools test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -65,10 +79,10 @@ async def test_writer_agent():
     """Test WriterAgent functionality"""
     print("\n🧪 Testing WriterAgent...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.writer import WriterAgent
-        from app.core import AgentType
-        
         # Create writer agent
         agent = WriterAgent("writer_001", "Test Writer")
         print("✅ WriterAgent created successfully")
@@ -117,7 +131,6 @@ async def test_writer_agent():
         
     except Exception as e:
         print(f"❌ WriterAgent test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -125,9 +138,10 @@ async def test_writer_agent_execution():
     """Test full WriterAgent execution workflow"""
     print("\n🧪 Testing WriterAgent execution workflow...")
     
+    if import_skipped(IMPORT_ERROR):
+        return False
+    
     try:
-        from app.agents.writer import WriterAgent
-        
         # Create writer agent
         agent = WriterAgent("writer_002", "Workflow Writer")
         
@@ -173,7 +187,6 @@ async def test_writer_agent_execution():
         
     except Exception as e:
         print(f"❌ WriterAgent execution test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 